@@ -83,8 +83,8 @@ LOG_MAX_BYTES = 10485760  # 10MB
 LOG_BACKUP_COUNT = 5
 
 # Security settings
-ALLOWED_FILE_EXTENSIONS = {".csv", ".xlsx", ".xls", ".twb", ".twbx", ".png", ".jpg", ".jpeg"}
-DANGEROUS_EXTENSIONS = {".exe", ".sh", ".bat", ".cmd", ".com", ".scr"}
+ALLOWED_FILE_EXTENSIONS = frozenset({".csv", ".xlsx", ".xls", ".twb", ".twbx", ".png", ".jpg", ".jpeg"})
+DANGEROUS_EXTENSIONS = frozenset({".exe", ".sh", ".bat", ".cmd", ".com", ".scr"})
 MAX_API_KEY_LENGTH = 200
 MIN_API_KEY_LENGTH = 20
 
@@ -0,0 +1,119 @@
+"""
+Unit tests for logging utilities module
+"""
+
+import pytest
+import json
+from datetime import datetime, timedelta
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.logging_utils import AuditLogger, AuditLogEntry
+
+
+def _entry_line(days_ago: int, action: str) -> str:
+    """Serialized audit line timestamped days_ago days in the past"""
+    entry = AuditLogEntry(
+        timestamp=datetime.now() - timedelta(days=days_ago),
+        action=action
+    )
+    return entry.to_json() + '\n'
+
+
+@pytest.fixture
+def audit_logger(tmp_path):
+    """Audit logger writing to a temporary directory"""
+    return AuditLogger(log_dir=tmp_path)
+
+
+def _write_lines(logger: AuditLogger, lines):
+    logger.audit_file.write_text(''.join(lines), encoding='utf-8')
+
+
+def _kept_actions(logger: AuditLogger):
+    actions = []
+    for line in logger.audit_file.read_text(encoding='utf-8').splitlines():
+        try:
+            actions.append(json.loads(line)['action'])
+        except json.JSONDecodeError:
+            actions.append(line)
+    return actions
+
+
+class TestCleanupOldLogs:
+    """Test audit log retention cleanup"""
+
+    def test_all_old_entries_deleted(self, audit_logger):
+        """Test every expired entry is removed"""
+        _write_lines(audit_logger, [_entry_line(100 - i, f'old{i}') for i in range(10)])
+
+        result = audit_logger.cleanup_old_logs(retention_days=30)
+
+        assert result['entries_deleted'] == 10
+        assert result['entries_kept'] == 0
+        assert audit_logger.audit_file.read_bytes() == b''
+
+    def test_all_new_entries_kept(self, audit_logger):
+        """Test nothing is removed when every entry is recent"""
+        lines = [_entry_line(10 - i, f'new{i}') for i in range(10)]
+        _write_lines(audit_logger, lines)
+
+        result = audit_logger.cleanup_old_logs(retention_days=30)
+
+        assert result['entries_deleted'] == 0
+        assert result['entries_kept'] == 10
+        assert audit_logger.audit_file.read_text(encoding='utf-8') == ''.join(lines)
+
+    def test_mixed_entries_split_at_cutoff(self, audit_logger):
+        """Test sorted file keeps exactly the entries after the cutoff"""
+        lines = [_entry_line(days, f'd{days}') for days in (90, 60, 45, 20, 5, 1)]
+        _write_lines(audit_logger, lines)
+
+        result = audit_logger.cleanup_old_logs(retention_days=30)
+
+        assert result['entries_deleted'] == 3
+        assert _kept_actions(audit_logger) == ['d20', 'd5', 'd1']
+
+    def test_malformed_line_kept(self, audit_logger):
+        """Test lines without a parseable timestamp are never dropped"""
+        _write_lines(audit_logger, [
+            _entry_line(90, 'old1'),
+            'not json at all\n',
+            _entry_line(60, 'old2'),
+            _entry_line(5, 'new1'),
+        ])
+
+        result = audit_logger.cleanup_old_logs(retention_days=30)
+
+        assert result['entries_deleted'] == 2
+        assert _kept_actions(audit_logger) == ['not json at all', 'new1']
+
+    def test_unsorted_recent_entry_not_lost(self, audit_logger):
+        """Test a recent entry among expired ones survives the binary search"""
+        _write_lines(audit_logger, [
+            _entry_line(90, 'old1'),
+            _entry_line(2, 'early_new'),
+            _entry_line(80, 'old2'),
+            _entry_line(70, 'old3'),
+            _entry_line(60, 'old4'),
+            _entry_line(1, 'new1'),
+        ])
+
+        audit_logger.cleanup_old_logs(retention_days=30)
+
+        kept = _kept_actions(audit_logger)
+        assert 'early_new' in kept
+        assert 'new1' in kept
+        assert 'old1' not in kept
+
+    def test_missing_file(self, tmp_path):
+        """Test cleanup is a no-op without an audit file"""
+        logger = AuditLogger(log_dir=tmp_path / 'empty')
+
+        assert logger.cleanup_old_logs(retention_days=30) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
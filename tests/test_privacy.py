@@ -57,6 +57,37 @@ class TestPIIDetector:
 
         assert 'phone' in report.detected_columns
 
+    def test_detect_by_content_pattern(self):
+        """Test detection of PII in columns with neutral names"""
+        df = pd.DataFrame({
+            'col_a': ['alice@example.com', 'bob@test.com', 'n/a'],
+            'col_b': ['123-45-6789', '987-65-4321', '111-22-3333'],
+            'col_c': ['10.0.0.1', '192.168.1.20', '172.16.0.5'],
+            'col_d': ['red', 'green', 'blue']
+        })
+
+        detector = PIIDetector()
+        report = detector.detect_pii_columns(df)
+
+        assert report.detection_method['col_a'] == 'email_pattern'
+        assert report.detection_method['col_b'] == 'ssn_pattern'
+        assert report.detection_method['col_c'] == 'ip_address_pattern'
+        assert 'col_d' not in report.detected_columns
+
+    def test_detection_cache_holds_no_raw_values(self):
+        """Test the cached detection decision is keyed on a digest, not raw PII"""
+        from utils import privacy
+
+        df = pd.DataFrame({'col_a': ['alice@example.com', 'bob@test.com', 'carol@demo.com']})
+        detector = PIIDetector()
+        first = detector.detect_pii_columns(df)
+        second = detector.detect_pii_columns(df)
+
+        assert first.detection_method == second.detection_method == {'col_a': 'email_pattern'}
+        assert privacy._PATTERN_DECISIONS
+        for key in privacy._PATTERN_DECISIONS:
+            assert 'alice@example.com' not in repr(key)
+
     def test_no_pii_detected(self, df_without_pii):
         """Test no false positives on clean data"""
         detector = PIIDetector()
@@ -102,6 +133,40 @@ class TestPIIMasker:
         assert len(df_masked['email'][0]) == 16
         assert df_masked['email'][0] != df_with_pii['email'][0]
 
+    def test_hash_mask_xxh3(self, df_with_pii):
+        """Test non-cryptographic xxh3 hash masking"""
+        pytest.importorskip('xxhash')
+
+        masker = PIIMasker(hash_algorithm='xxh3')
+        df_masked, _ = masker.mask_dataframe(
+            df_with_pii,
+            pii_columns=['email'],
+            method='hash'
+        )
+
+        assert len(df_masked['email'][0]) == 16
+        assert df_masked['email'][0] == masker._hash_value(df_with_pii['email'][0])
+        assert df_masked['email'][0] != PIIMasker()._hash_value(df_with_pii['email'][0])
+
+    def test_unknown_hash_algorithm(self):
+        """Test unknown hash algorithm is rejected"""
+        with pytest.raises(ValueError):
+            PIIMasker(hash_algorithm='md5')
+
+    def test_mask_categorical_column(self):
+        """Test categorical columns are masked per category"""
+        df = pd.DataFrame({
+            'email': pd.Categorical(['alice@example.com', 'bob@test.com', None, 'alice@example.com'])
+        })
+
+        masker = PIIMasker()
+        df_masked, report = masker.mask_dataframe(df, pii_columns=['email'], method='partial')
+
+        assert df_masked['email'][0] == masker._partial_mask('alice@example.com')
+        assert df_masked['email'][0] == df_masked['email'][3]
+        assert pd.isna(df_masked['email'][2])
+        assert report.total_values_masked['email'] == 3
+
     def test_remove_pii(self, df_with_pii):
         """Test PII column removal"""
         masker = PIIMasker()
@@ -170,6 +235,23 @@ class TestDataMinimizer:
         df_random, _ = minimizer.minimize_for_ai(df, sample_method='random')
         assert len(df_random) == 10
 
+    def test_stratified_sampling(self):
+        """Test stratified sampling draws evenly from each group"""
+        df = pd.DataFrame({
+            'segment': ['A', 'B', 'C', 'D'] * 50,
+            'value': range(200)
+        })
+
+        minimizer = DataMinimizer(max_rows=20)
+        df_strat, _ = minimizer.minimize_for_ai(
+            df,
+            auto_mask_pii=False,
+            sample_method='stratified'
+        )
+
+        assert len(df_strat) == 20
+        assert df_strat['segment'].value_counts().to_dict() == {'A': 5, 'B': 5, 'C': 5, 'D': 5}
+
     def test_auto_pii_masking(self, df_with_pii):
         """Test automatic PII masking during minimization"""
         minimizer = DataMinimizer(max_rows=10)
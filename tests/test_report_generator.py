@@ -0,0 +1,145 @@
+"""
+Unit tests for report generator module
+"""
+
+import pytest
+import zipfile
+import pandas as pd
+from io import BytesIO
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.report_generator import ReportGenerator, _df_to_csv_bytes
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Report generator exporting to a temporary directory"""
+    return ReportGenerator(exports_dir=tmp_path)
+
+
+@pytest.fixture
+def df_nested():
+    """DataFrame with list, dict, datetime and boolean columns"""
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'tags': [['a', 'b'], [], ['c']],
+        'attrs': [{'k': 1}, {'k': 2}, {}],
+        'when': pd.date_range('2024-01-01', periods=3),
+        'active': [True, False, True]
+    })
+
+
+class TestCSVExport:
+    """Test CSV serialisation for exports"""
+
+    def test_nested_and_datetime_columns(self, df_nested):
+        """Test list/dict columns export and output matches pandas"""
+        csv_bytes = _df_to_csv_bytes(df_nested)
+
+        assert csv_bytes.decode('utf-8') == df_nested.to_csv(index=False)
+
+    def test_datetime_and_bool_format(self):
+        """Test datetimes and booleans are formatted as pandas does"""
+        df = pd.DataFrame({
+            'when': pd.to_datetime(['2024-01-01', '2024-01-02']),
+            'flag': [True, False]
+        })
+
+        text = _df_to_csv_bytes(df).decode('utf-8')
+
+        assert '2024-01-01' in text
+        assert '00:00:00.000000000' not in text
+        assert 'True' in text and 'true' not in text
+
+    def test_simple_numeric_frame_round_trips(self):
+        """Test plain numeric/string frames round-trip through CSV"""
+        df = pd.DataFrame({'a': [1, 2, 3], 'b': [0.5, 1.5, 2.5], 'c': ['x', 'y,z', 'w']})
+
+        round_trip = pd.read_csv(BytesIO(_df_to_csv_bytes(df)))
+
+        pd.testing.assert_frame_equal(round_trip, df)
+
+
+class TestHTMLReport:
+    """Test HTML report rendering"""
+
+    def test_sections_rendered_and_escaped(self, generator):
+        """Test anomaly and visualization sections render with escaping"""
+        path = generator.generate_html_report(
+            'report',
+            'Sales <Q1>',
+            {'rows': 10},
+            anomalies=[{'severity': 'high', 'description': '<script>x</script>'}],
+            visualizations=[{'viz_type': 'Bar Chart', 'use_case': 'Compare', 'description': 'Totals'}]
+        )
+
+        html = path.read_text(encoding='utf-8')
+        assert 'Detected Anomalies' in html
+        assert 'Bar Chart' in html
+        assert '<script>x</script>' not in html
+        assert 'Sales &lt;Q1&gt;' in html
+
+
+class TestPDFReport:
+    """Test PDF report generation"""
+
+    def test_empty_report(self, generator):
+        """Test a report with no content still renders a PDF"""
+        path = generator.generate_pdf_report('empty', 'Empty Report', {})
+
+        assert path.read_bytes().startswith(b'%PDF')
+
+    def test_report_with_summary(self, generator):
+        """Test a report with a data summary renders a PDF"""
+        path = generator.generate_pdf_report('summary', 'Summary', {'rows': 1000, 'columns': 5})
+
+        assert path.read_bytes().startswith(b'%PDF')
+
+
+class TestBatchDownload:
+    """Test batch archive export"""
+
+    def test_zip_with_nested_and_datetime_columns(self, generator, df_nested):
+        """Test a ZIP export containing list and datetime columns"""
+        path = generator.create_batch_download_zip({'data.csv': df_nested}, 'batch')
+
+        with zipfile.ZipFile(path) as zipf:
+            content = zipf.read('cleaned_data.csv').decode('utf-8')
+
+        assert content == df_nested.to_csv(index=False)
+
+    def test_text_heavy_frame_sized_by_content(self, generator, monkeypatch):
+        """Test string payloads count towards the stored-ZIP threshold"""
+        from utils import report_generator
+
+        df = pd.DataFrame({'text': ['x' * 1000] * 100})
+        shallow = int(df.memory_usage(index=False).sum())
+        monkeypatch.setattr(report_generator, 'ZIP_STORED_THRESHOLD_BYTES', shallow * 10)
+
+        path = generator.create_batch_download_zip({'text.csv': df}, 'text_batch')
+
+        with zipfile.ZipFile(path) as zipf:
+            assert zipf.getinfo('cleaned_text.csv').compress_type == zipfile.ZIP_STORED
+
+    def test_tzst_archive(self, generator, df_nested):
+        """Test zstandard-compressed tar export"""
+        pytest.importorskip('zstandard')
+
+        path = generator.create_batch_download_zip(
+            {'data.csv': df_nested}, 'batch', archive_format='tzst'
+        )
+
+        assert path.name == 'batch.tar.zst'
+        assert path.stat().st_size > 0
+
+    def test_unknown_archive_format(self, generator, df_nested):
+        """Test unknown archive formats are rejected"""
+        with pytest.raises(ValueError):
+            generator.create_batch_download_zip({'data.csv': df_nested}, 'batch', archive_format='rar')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,223 @@
+"""
+Unit tests for screenshot analysis module
+"""
+
+import pytest
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from PIL import Image
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import screenshot_analysis
+from utils.screenshot_analysis import (
+    DashboardScreenshotAnalyzer,
+    ScreenshotAnalysis,
+    ANALYSIS_TOOL_NAME
+)
+
+
+TOOL_INPUT = {
+    'overall_score': 82,
+    'aspect_scores': {'layout_clarity': 80},
+    'strengths': ['Clear layout'],
+    'weaknesses': [],
+    'recommendations': ['Add a legend'],
+    'accessibility_issues': [],
+    'detailed_feedback': {'layout_clarity': 'Good'}
+}
+
+
+def _tool_message():
+    """Response message whose content is a single analysis tool call"""
+    return SimpleNamespace(content=[
+        SimpleNamespace(type='tool_use', name=ANALYSIS_TOOL_NAME, input=TOOL_INPUT)
+    ])
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """Analyzer constructed without an API key"""
+    monkeypatch.delenv('ANTHROPIC_API_KEY', raising=False)
+    return DashboardScreenshotAnalyzer()
+
+
+@pytest.fixture
+def screenshots(tmp_path):
+    """Five valid PNG screenshots"""
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"dashboard_{i}.png"
+        Image.new('RGB', (600, 500), (i * 40, 100, 200)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+class FakeBatches:
+    """In-memory stand-in for client.messages.batches"""
+
+    def __init__(self):
+        self.submitted = {}
+
+    def create(self, requests):
+        batch_id = f"batch-{len(self.submitted)}"
+        self.submitted[batch_id] = requests
+        return SimpleNamespace(id=batch_id, processing_status='ended')
+
+    def retrieve(self, batch_id):
+        return SimpleNamespace(id=batch_id, processing_status='ended')
+
+    def results(self, batch_id):
+        return [
+            SimpleNamespace(
+                custom_id=request['custom_id'],
+                result=SimpleNamespace(type='succeeded', message=_tool_message())
+            )
+            for request in self.submitted[batch_id]
+        ]
+
+
+class TestBatchAnalysis:
+    """Test Message Batches analysis"""
+
+    def _enable_batches(self, analyzer):
+        batches = FakeBatches()
+        analyzer.client = MagicMock()
+        analyzer.client.messages.batches = batches
+        analyzer.ai_available = True
+        return batches
+
+    def test_empty_input_sends_nothing(self, analyzer):
+        """Test an empty input returns no results without submitting a batch"""
+        batches = self._enable_batches(analyzer)
+
+        assert analyzer.analyze_screenshots_batch([]) == {}
+        assert batches.submitted == {}
+
+    def test_single_batch(self, analyzer, screenshots):
+        """Test a small input goes out as one batch"""
+        batches = self._enable_batches(analyzer)
+
+        results = analyzer.analyze_screenshots_batch(screenshots)
+
+        assert len(batches.submitted) == 1
+        assert set(results) == set(screenshots)
+        assert all(r.overall_score == 82 for r in results.values())
+
+    def test_split_by_payload_size(self, analyzer, screenshots, monkeypatch):
+        """Test requests are split so no batch exceeds the byte budget"""
+        batches = self._enable_batches(analyzer)
+        monkeypatch.setattr(screenshot_analysis, 'MAX_BATCH_BYTES', 12_000)
+
+        results = analyzer.analyze_screenshots_batch(screenshots)
+
+        assert len(batches.submitted) > 1
+        submitted_ids = [r['custom_id'] for reqs in batches.submitted.values() for r in reqs]
+        assert len(submitted_ids) == len(set(submitted_ids)) == len(screenshots)
+        assert set(results) == set(screenshots)
+        assert all(r.image_metadata for r in results.values())
+
+    def test_split_by_request_count(self, analyzer, screenshots, monkeypatch):
+        """Test requests are split at the per-batch request limit"""
+        batches = self._enable_batches(analyzer)
+        monkeypatch.setattr(screenshot_analysis, 'MAX_BATCH_REQUESTS', 2)
+
+        results = analyzer.analyze_screenshots_batch(screenshots)
+
+        assert [len(reqs) for reqs in batches.submitted.values()] == [2, 2, 1]
+        assert len(results) == len(screenshots)
+
+    def test_basic_analysis_without_ai(self, analyzer, screenshots):
+        """Test batch analysis falls back to basic analysis without AI"""
+        results = analyzer.analyze_screenshots_batch(screenshots)
+
+        assert set(results) == set(screenshots)
+        assert all(isinstance(r, ScreenshotAnalysis) for r in results.values())
+
+
+class FakeAsyncMessages:
+    """Stand-in for AsyncAnthropic().messages that records concurrency"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def create(self, **params):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return _tool_message()
+        finally:
+            self.in_flight -= 1
+
+
+class TestAnalyzeMany:
+    """Test concurrent single-shot analysis"""
+
+    def _enable_async(self, analyzer, monkeypatch):
+        messages = FakeAsyncMessages()
+        analyzer.async_client = SimpleNamespace(messages=messages)
+
+        # Track how many encoded payloads exist at once
+        build = analyzer._build_request_params
+        live = {'now': 0, 'max': 0}
+
+        def tracked_build(*args, **kw):
+            live['now'] += 1
+            live['max'] = max(live['max'], live['now'])
+            return build(*args, **kw)
+
+        async def tracked_create(**params):
+            try:
+                return await FakeAsyncMessages.create(messages, **params)
+            finally:
+                live['now'] -= 1
+
+        monkeypatch.setattr(analyzer, '_build_request_params', tracked_build)
+        monkeypatch.setattr(messages, 'create', tracked_create)
+        return messages, live
+
+    def test_payloads_bounded_by_concurrency(self, analyzer, screenshots, monkeypatch):
+        """Test no more than max_concurrency images are encoded at once"""
+        messages, live = self._enable_async(analyzer, monkeypatch)
+
+        results = asyncio.run(analyzer.analyze_many(screenshots, max_concurrency=2))
+
+        assert messages.calls == len(screenshots)
+        assert messages.max_in_flight <= 2
+        assert live['max'] <= 2
+        assert all(r.overall_score == 82 for r in results.values())
+
+    def test_missing_file_reported_per_path(self, analyzer, screenshots, monkeypatch):
+        """Test a missing screenshot yields its exception without failing the rest"""
+        self._enable_async(analyzer, monkeypatch)
+        missing = str(Path(screenshots[0]).with_name('missing.png'))
+
+        results = asyncio.run(analyzer.analyze_many([missing] + screenshots[:2]))
+
+        assert isinstance(results[missing], FileNotFoundError)
+        assert all(isinstance(results[p], ScreenshotAnalysis) for p in screenshots[:2])
+
+    def test_api_error_falls_back_to_basic(self, analyzer, screenshots, monkeypatch):
+        """Test an API error falls back to basic analysis for that screenshot"""
+        messages, _ = self._enable_async(analyzer, monkeypatch)
+
+        async def failing_create(**params):
+            raise RuntimeError('overloaded')
+
+        monkeypatch.setattr(messages, 'create', failing_create)
+
+        results = asyncio.run(analyzer.analyze_many(screenshots[:1]))
+
+        analysis = results[screenshots[0]]
+        assert any('AI analysis failed: overloaded' in r for r in analysis.recommendations)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
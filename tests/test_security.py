@@ -0,0 +1,71 @@
+"""
+Unit tests for security module
+"""
+
+import pytest
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import security
+from utils.security import SecurityManager
+
+
+CSV_CONTENT = b"name,email\nalice,alice@example.com\nbob,bob@test.com\n"
+
+
+@pytest.fixture
+def fake_magic(monkeypatch):
+    """libmagic stand-in that records each buffer it is asked to sniff"""
+    calls = []
+
+    def from_buffer(buffer, mime=False):
+        calls.append(buffer)
+        return 'text/csv'
+
+    monkeypatch.setattr(security, 'magic', SimpleNamespace(from_buffer=from_buffer), raising=False)
+    monkeypatch.setattr(security, 'MAGIC_AVAILABLE', True)
+    monkeypatch.setattr(security, '_MIME_TYPES', OrderedDict())
+    return calls
+
+
+class TestMIMEDetection:
+    """Test MIME type detection during file validation"""
+
+    def test_repeat_upload_detected_once(self, fake_magic):
+        """Test identical uploads reuse the cached MIME type"""
+        manager = SecurityManager()
+
+        assert manager.validate_file(Path('a.csv'), CSV_CONTENT) == (True, None)
+        assert manager.validate_file(Path('b.csv'), CSV_CONTENT) == (True, None)
+
+        assert len(fake_magic) == 1
+
+    def test_cache_holds_no_file_content(self, fake_magic):
+        """Test the MIME cache is keyed on a digest, not the uploaded bytes"""
+        SecurityManager().validate_file(Path('a.csv'), CSV_CONTENT)
+
+        assert list(security._MIME_TYPES.values()) == ['text/csv']
+        for digest, length in security._MIME_TYPES:
+            assert len(digest) == 16
+            assert b'alice@example.com' not in digest
+            assert length == len(CSV_CONTENT)
+
+    def test_cache_is_bounded(self, fake_magic, monkeypatch):
+        """Test the least recently used entry is evicted at capacity"""
+        monkeypatch.setattr(security, '_MIME_TYPES_MAXSIZE', 2)
+
+        for head in (b'first', b'second', b'first', b'third'):
+            security._detect_mime(head)
+
+        assert len(security._MIME_TYPES) == 2
+        security._detect_mime(b'first')
+        security._detect_mime(b'second')
+        assert fake_magic == [b'first', b'second', b'third', b'second']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,163 @@
+"""
+Unit tests for session manager module
+"""
+
+import pytest
+import json
+import os
+import threading
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.session_manager import SessionManager, INDEX_FILENAME, _atomic_write
+
+
+MESSAGES = [
+    {'role': 'user', 'content': 'Summarize sales'},
+    {'role': 'assistant', 'content': 'Sales grew 5%'}
+]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Session manager storing sessions in a temporary directory"""
+    return SessionManager(sessions_dir=tmp_path)
+
+
+def _read_index(manager: SessionManager):
+    return json.loads((manager.sessions_dir / INDEX_FILENAME).read_text(encoding='utf-8'))
+
+
+class TestSessionIndex:
+    """Test the session index"""
+
+    def test_index_created_on_save(self, manager):
+        """Test saving a session writes its index entry"""
+        session_id = manager.save_session(MESSAGES, [], session_name='Q1 review')
+
+        index = _read_index(manager)
+        assert index[session_id]['session_name'] == 'Q1 review'
+        assert index[session_id]['message_count'] == 2
+
+    def test_index_updated_on_resave(self, manager):
+        """Test saving the same session again replaces its entry"""
+        session_id = manager.save_session(MESSAGES, [], session_name='Q1 review')
+        manager.save_session(MESSAGES + MESSAGES, [{'name': 'a.csv'}], session_name='Q1 review')
+
+        sessions = manager.list_sessions()
+        assert len(sessions) == 1
+        assert sessions[0]['session_id'] == session_id
+        assert sessions[0]['message_count'] == 4
+        assert sessions[0]['file_count'] == 1
+
+    def test_index_entry_removed_on_delete(self, manager):
+        """Test deleting a session drops its index entry"""
+        session_id = manager.save_session(MESSAGES, [], session_name='Q1 review')
+
+        assert manager.delete_session(session_id) is True
+        assert manager.list_sessions() == []
+        assert session_id not in _read_index(manager)
+
+    def test_index_rebuilt_when_missing(self, manager, tmp_path):
+        """Test a fresh manager rebuilds a deleted index from the session files"""
+        first = manager.save_session(MESSAGES, [], session_name='first')
+        second = manager.save_session(MESSAGES, [], session_name='second')
+        (tmp_path / INDEX_FILENAME).unlink()
+
+        sessions = SessionManager(sessions_dir=tmp_path).list_sessions()
+
+        assert {s['session_id'] for s in sessions} == {first, second}
+        assert (tmp_path / INDEX_FILENAME).exists()
+
+    def test_index_rebuilt_when_corrupt(self, manager, tmp_path):
+        """Test an unreadable index is rebuilt"""
+        session_id = manager.save_session(MESSAGES, [], session_name='first')
+        (tmp_path / INDEX_FILENAME).write_text('{not json', encoding='utf-8')
+
+        sessions = SessionManager(sessions_dir=tmp_path).list_sessions()
+
+        assert [s['session_id'] for s in sessions] == [session_id]
+
+    def test_changes_from_other_manager_visible(self, manager, tmp_path):
+        """Test sessions saved or deleted by another manager are picked up"""
+        assert manager.list_sessions() == []
+
+        other = SessionManager(sessions_dir=tmp_path)
+        session_id = other.save_session(MESSAGES, [], session_name='shared')
+        assert [s['session_id'] for s in manager.list_sessions()] == [session_id]
+
+        other.delete_session(session_id)
+        assert manager.list_sessions() == []
+
+    def test_list_returns_copies(self, manager):
+        """Test mutating listed sessions does not change the index"""
+        manager.save_session(MESSAGES, [], session_name='Q1 review')
+
+        manager.list_sessions()[0]['session_name'] = 'changed'
+
+        assert manager.list_sessions()[0]['session_name'] == 'Q1 review'
+
+    def test_cleanup_removes_old_sessions(self, manager, tmp_path):
+        """Test expired sessions are removed from disk and the index"""
+        old_id = manager.save_session(MESSAGES, [], session_name='old')
+        new_id = manager.save_session(MESSAGES, [], session_name='new')
+
+        old_file = tmp_path / f"{old_id}.json"
+        data = json.loads(old_file.read_text(encoding='utf-8'))
+        data['created_at'] = '2000-01-01T00:00:00'
+        replacement = tmp_path / 'replacement.tmp'
+        replacement.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(replacement, old_file)
+
+        assert manager.cleanup_old_sessions(max_age_days=30) == 1
+        assert not old_file.exists()
+        assert [s['session_id'] for s in manager.list_sessions()] == [new_id]
+
+
+class TestAtomicWrite:
+    """Test atomic session file writes"""
+
+    def test_concurrent_writes_never_tear(self, tmp_path):
+        """Test concurrent writers of one file leave one complete version"""
+        target = tmp_path / 'session.json'
+        payloads = [bytes([65 + i]) * 200_000 for i in range(8)]
+        errors = []
+
+        def write(payload):
+            try:
+                for _ in range(5):
+                    _atomic_write(target, payload)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(p,)) for p in payloads]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert target.read_bytes() in payloads
+        assert list(tmp_path.glob('*.tmp')) == []
+
+    def test_failed_write_leaves_target_and_no_temp(self, tmp_path, monkeypatch):
+        """Test a failed write keeps the old file and removes its temp file"""
+        target = tmp_path / 'session.json'
+        target.write_bytes(b'old')
+
+        def fail_replace(src, dst):
+            raise OSError('disk full')
+
+        monkeypatch.setattr(os, 'replace', fail_replace)
+
+        with pytest.raises(OSError):
+            _atomic_write(target, b'new')
+
+        assert target.read_bytes() == b'old'
+        assert list(tmp_path.glob('*.tmp')) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,136 @@
+"""
+Unit tests for SQL utilities module
+"""
+
+import pytest
+import sqlite3
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.sql_utils import TableauSQLGenerator
+from utils import generate_tableau_sql
+
+
+class TestParameterizedSelect:
+    """Test parameterized SELECT generation"""
+
+    @pytest.mark.parametrize('database_type, placeholder', [
+        ('postgres', '%s'),
+        ('mysql', '%s'),
+        ('redshift', '%s'),
+        ('sqlserver', '?'),
+        ('snowflake', '?'),
+        ('generic', '?'),
+    ])
+    def test_paramstyle_per_database(self, database_type, placeholder):
+        """Test each database type uses its DB-API placeholder"""
+        generator = TableauSQLGenerator(database_type)
+
+        sql, params = generator.generate_select_query('sales', filters={'region': 'West', 'year': 2024})
+
+        assert f"WHERE region = {placeholder} AND year = {placeholder}" in sql
+        assert params == ['West', 2024]
+
+    def test_list_filter_becomes_in_clause(self):
+        """Test list values expand to one placeholder per member"""
+        generator = TableauSQLGenerator('postgres')
+
+        sql, params = generator.generate_select_query('sales', filters={'region': ['West', 'East', 3]})
+
+        assert "WHERE region IN (%s, %s, %s)" in sql
+        assert params == ['West', 'East', 3]
+
+    def test_quotes_in_values_not_inlined(self):
+        """Test filter values never appear in the SQL text"""
+        generator = TableauSQLGenerator('generic')
+        value = "O'Brien'; DROP TABLE sales; --"
+
+        sql, params = generator.generate_select_query('sales', filters={'name': value, 'tags': [value]})
+
+        assert value not in sql
+        assert "'" not in sql
+        assert params == [value, value]
+
+    def test_unsupported_values_skipped(self):
+        """Test filter values of unsupported types add no condition"""
+        generator = TableauSQLGenerator('generic')
+
+        sql, params = generator.generate_select_query('sales', filters={'region': None})
+
+        assert 'WHERE' not in sql
+        assert params == []
+
+    def test_limit_rendering(self):
+        """Test LIMIT and TOP are rendered per database type"""
+        sql, _ = TableauSQLGenerator('postgres').generate_select_query('sales', limit=10)
+        assert sql.endswith('\nLIMIT 10')
+
+        sql, _ = TableauSQLGenerator('sqlserver').generate_select_query('sales', limit=10)
+        assert sql.startswith('SELECT TOP 10 *')
+
+    def test_executes_with_driver_binding(self):
+        """Test generated SQL and params run against a qmark driver"""
+        conn = sqlite3.connect(':memory:')
+        conn.execute("CREATE TABLE sales (name TEXT, amount INTEGER)")
+        conn.executemany(
+            "INSERT INTO sales VALUES (?, ?)",
+            [("O'Brien", 10), ('Smith', 20), ('Jones', 30)]
+        )
+
+        sql, params = TableauSQLGenerator('generic').generate_select_query(
+            'sales',
+            columns=['name', 'amount'],
+            filters={'name': ["O'Brien", 'Jones']},
+            order_by=['amount']
+        )
+
+        assert conn.execute(sql, params).fetchall() == [("O'Brien", 10), ('Jones', 30)]
+
+
+class TestParameterizedAggregation:
+    """Test parameterized aggregation generation"""
+
+    def test_having_params_follow_where_params(self):
+        """Test HAVING values are bound after WHERE values, in clause order"""
+        generator = TableauSQLGenerator('postgres')
+
+        sql, params = generator.generate_aggregation_query(
+            'sales',
+            group_by=['region'],
+            metrics={'amount': 'SUM'},
+            filters={'year': 2024, 'channel': 'web'},
+            having={'amount_sum': 1000}
+        )
+
+        assert "WHERE year = %s AND channel = %s" in sql
+        assert "HAVING amount_sum > %s" in sql
+        assert sql.index('WHERE') < sql.index('GROUP BY') < sql.index('HAVING')
+        assert params == [2024, 'web', 1000]
+
+    def test_list_filters_ignored(self):
+        """Test list filters are not supported in aggregation queries"""
+        generator = TableauSQLGenerator('generic')
+
+        sql, params = generator.generate_aggregation_query(
+            'sales', ['region'], {'amount': 'SUM'}, filters={'region': ['West']}
+        )
+
+        assert 'WHERE' not in sql
+        assert params == []
+
+
+class TestConvenienceFunctions:
+    """Test convenience functions"""
+
+    def test_generate_tableau_sql_returns_params(self):
+        """Test one-line generation returns the SQL with its parameters"""
+        sql, params = generate_tableau_sql('sales', database_type='mysql', filters={'region': 'West'})
+
+        assert sql == "SELECT *\nFROM sales\nWHERE region = %s"
+        assert params == ['West']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -62,6 +62,7 @@ from .logging_utils import (
     SessionLogger,
     PIISafeFormatter,
     setup_application_logging,
+    get_app_logger,
     generate_session_id
 )
 
@@ -141,6 +142,7 @@ __all__ = [
     'SessionLogger',
     'PIISafeFormatter',
     'setup_application_logging',
+    'get_app_logger',
     'generate_session_id',
 
     # Screenshot Analysis
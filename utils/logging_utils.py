@@ -3,13 +3,16 @@ Logging utilities for Tableau Data Assistant
 Provides audit logging, session tracking, and PII-safe logging
 """
 
+import functools
 import logging
 import json
+import os
+import re
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-import hashlib
+import secrets
 
 from config.settings import (
     LOG_LEVEL,
@@ -23,8 +26,19 @@ from config.settings import (
     LOGS_DIR
 )
 
+# Audit entries serialize timestamp first, so anchoring at the line start
+# avoids matching a "timestamp" key nested inside details
+_TS_RE = re.compile(rb'\{"timestamp":\s*"([^"]+)"')
+_COPY_BUFFER_SIZE = 1024 * 1024
 
-@dataclass
+
+def _extract_timestamp(line: bytes) -> Optional[bytes]:
+    """Extract the raw ISO-8601 timestamp from a serialized audit line"""
+    match = _TS_RE.match(line)
+    return match.group(1) if match else None
+
+
+@dataclass(slots=True)
 class AuditLogEntry:
     """Single audit log entry"""
     timestamp: datetime = field(default_factory=datetime.now)
@@ -39,9 +53,20 @@ class AuditLogEntry:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        return data
+        # Built directly rather than via asdict(), which deep-copies details
+        # on every write. Field order is the on-disk order; timestamp must
+        # stay first for _TS_RE.
+        return {
+            'timestamp': self.timestamp.isoformat(),
+            'session_id': self.session_id,
+            'user_id': self.user_id,
+            'action': self.action,
+            'resource': self.resource,
+            'details': self.details,
+            'status': self.status,
+            'duration_ms': self.duration_ms,
+            'error_message': self.error_message
+        }
 
     def to_json(self) -> str:
         """Convert to JSON string"""
@@ -122,8 +147,19 @@ class AuditLogger:
     """
     Audit logger for tracking user actions and data operations
     Maintains PII-safe audit trail
+
+    One instance is shared per log directory, so per-session loggers do
+    not repeat directory setup.
     """
 
+    _instances = {}
+
+    def __new__(cls, log_dir: Path = LOGS_DIR):
+        key = Path(log_dir)
+        if key not in cls._instances:
+            cls._instances[key] = super().__new__(cls)
+        return cls._instances[key]
+
     def __init__(self, log_dir: Path = LOGS_DIR):
         """
         Initialize audit logger
@@ -131,6 +167,10 @@ class AuditLogger:
         Args:
             log_dir: Directory for audit logs
         """
+        if getattr(self, '_initialized', False):
+            return
+        self._initialized = True
+
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
 
@@ -214,10 +254,21 @@ class AuditLogger:
 
         entries = []
 
-        with open(self.audit_file, 'r', encoding='utf-8') as f:
+        # Cheap substring prefilters reject most lines before JSON decoding;
+        # survivors are still checked exactly below
+        needles = [
+            f'"{key}": {json.dumps(value)}'.encode('ascii')
+            for key, value in (('session_id', session_id), ('action', action))
+            if value
+        ]
+
+        with open(self.audit_file, 'rb') as f:
             for line in f:
+                if needles and not all(needle in line for needle in needles):
+                    continue
+
                 try:
-                    entry = json.loads(line.strip())
+                    entry = json.loads(line)
 
                     # Apply filters
                     if session_id and entry.get('session_id') != session_id:
@@ -275,6 +326,14 @@ class AuditLogger:
         """
         Clean up audit logs older than retention period
 
+        Entries are appended in time order, so the cutoff is located by
+        binary search over byte offsets and the retained tail is copied
+        without being parsed. ISO-8601 timestamps compare correctly as
+        strings, so no datetime parsing is needed per probe. If the file
+        is not fully sorted, no recent entry is lost: lines before the
+        cutoff offset are checked individually, and stale lines after it
+        are simply retained until a later cleanup.
+
         Args:
             retention_days: Number of days to retain logs
         """
@@ -282,28 +341,35 @@ class AuditLogger:
             return
 
         cutoff_date = datetime.now() - timedelta(days=retention_days)
+        cutoff = cutoff_date.isoformat().encode('ascii')
         temp_file = self.audit_file.with_suffix('.tmp')
 
         entries_kept = 0
         entries_deleted = 0
 
-        with open(self.audit_file, 'r', encoding='utf-8') as infile:
-            with open(temp_file, 'w', encoding='utf-8') as outfile:
-                for line in infile:
-                    try:
-                        entry = json.loads(line.strip())
-                        entry_time = datetime.fromisoformat(entry['timestamp'])
-
-                        if entry_time >= cutoff_date:
-                            outfile.write(line)
-                            entries_kept += 1
-                        else:
-                            entries_deleted += 1
-
-                    except (json.JSONDecodeError, KeyError, ValueError):
-                        # Keep malformed entries to avoid data loss
+        with open(self.audit_file, 'rb') as infile:
+            offset = self._find_cutoff_offset(infile, cutoff)
+
+            with open(temp_file, 'wb') as outfile:
+                # Expired region: drop timestamped lines older than the
+                # cutoff. Malformed entries and out-of-order recent entries
+                # (clock changes, merged files) are kept to avoid data loss.
+                infile.seek(0)
+                for line in infile.read(offset).splitlines(keepends=True):
+                    timestamp = _extract_timestamp(line)
+                    if timestamp is None or timestamp >= cutoff:
                         outfile.write(line)
                         entries_kept += 1
+                    else:
+                        entries_deleted += 1
+
+                # Retained region: copy through in large blocks
+                while True:
+                    block = infile.read(_COPY_BUFFER_SIZE)
+                    if not block:
+                        break
+                    outfile.write(block)
+                    entries_kept += block.count(b'\n')
 
         # Replace original file with cleaned version
         temp_file.replace(self.audit_file)
@@ -314,6 +380,47 @@ class AuditLogger:
             'cutoff_date': cutoff_date.isoformat()
         }
 
+    @staticmethod
+    def _find_cutoff_offset(f, cutoff: bytes) -> int:
+        """
+        Find the byte offset of the first line timestamped at or after cutoff
+
+        Args:
+            f: Audit file opened in binary mode
+            cutoff: ISO-8601 cutoff timestamp as bytes
+
+        Returns:
+            Offset of the first line to keep (file size if none)
+        """
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+
+        def first_line_at(pos: int):
+            # Return (start, timestamp) of the first parseable line starting
+            # at or after pos; timestamp is None at end of file
+            if pos > 0:
+                f.seek(pos - 1)
+                f.readline()
+            else:
+                f.seek(0)
+            start = f.tell()
+            for line in iter(f.readline, b''):
+                timestamp = _extract_timestamp(line)
+                if timestamp is not None:
+                    return start, timestamp
+            return size, None
+
+        lo, hi = 0, size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            _, timestamp = first_line_at(mid)
+            if timestamp is None or timestamp >= cutoff:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        return first_line_at(lo)[0]
+
     def _sanitize_details(self, details: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize details dictionary for PII-safe logging"""
         sanitized = {}
@@ -549,15 +656,25 @@ def generate_session_id() -> str:
     Generate unique session ID
 
     Returns:
-        Unique session identifier
+        Unique session identifier (16 lowercase hex characters)
+    """
+    return secrets.token_hex(8)
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_logger() -> logging.Logger:
     """
-    timestamp = datetime.now().isoformat()
-    random_data = str(datetime.now().timestamp())
-    combined = f"{timestamp}_{random_data}"
+    Get the application-wide logger, configuring it on first use
 
-    hash_obj = hashlib.sha256(combined.encode())
-    return hash_obj.hexdigest()[:16]
+    Returns:
+        Configured logger instance
+    """
+    return setup_application_logging()
 
 
-# Global logger instance
-app_logger = setup_application_logging()
+def __getattr__(name: str) -> Any:
+    # Keep `from utils.logging_utils import app_logger` working without
+    # creating log handlers and files at import time
+    if name == 'app_logger':
+        return get_app_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
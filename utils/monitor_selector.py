@@ -2,7 +2,9 @@
 Multi-monitor support for dual-screen setups
 Allows selecting specific monitors for capture while keeping browser separate
 """
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
+import threading
 
 try:
     import tkinter as tk
@@ -24,6 +26,7 @@ except ImportError:
     MACOS_AVAILABLE = False
 
 from utils.logger import get_logger
+from utils.window_selector import ScreenBorderOverlay
 
 logger = get_logger(__name__)
 
@@ -245,17 +248,19 @@ class MonitorSelector:
 
             listbox.insert(tk.END, display_text)
 
-            # Add separator except for last item
-            if i < len(self.monitors) - 1:
-                listbox.insert(tk.END, "─" * 60)
+            # Shade alternate rows instead of inserting separator rows, so
+            # listbox indices stay 1:1 with self.monitors
+            if i % 2:
+                listbox.itemconfig(i, background="#eeeeee")
 
         # Pre-select primary monitor
         for i, monitor in enumerate(self.monitors):
             if monitor.get('primary'):
-                listbox.selection_set(i * 2)  # Account for separators
+                listbox.selection_set(i)
                 break
 
         listbox.bind('<Double-Button-1>', on_monitor_select)
+        listbox.bind('<Return>', on_monitor_select)
 
         # Buttons
         button_frame = tk.Frame(root, bg="white", pady=15)
@@ -329,8 +334,6 @@ class MonitorSelector:
             logger.warning("tkinter not available, cannot show preview border")
             return
 
-        from utils.window_selector import ScreenBorderOverlay
-
         overlay = ScreenBorderOverlay(
             monitor['x'],
             monitor['y'],
@@ -341,7 +344,6 @@ class MonitorSelector:
         )
 
         # Show for 2 seconds
-        import threading
         def show_and_hide():
             overlay.show()
 
@@ -385,6 +387,12 @@ def select_monitor(title: str = "Select Monitor for Tableau") -> Optional[Tuple[
     return None
 
 
+@lru_cache(maxsize=1)
+def _get_shared_selector() -> MonitorSelector:
+    """Detect monitors once, on first use, for the module-level helpers"""
+    return MonitorSelector()
+
+
 def get_left_monitor() -> Optional[Dict]:
     """
     Get the leftmost monitor (usually where Tableau would be)
@@ -392,8 +400,7 @@ def get_left_monitor() -> Optional[Dict]:
     Returns:
         Monitor dictionary or None
     """
-    selector = MonitorSelector()
-    monitors = selector.get_monitors()
+    monitors = _get_shared_selector().get_monitors()
 
     if not monitors:
         return None
@@ -411,8 +418,7 @@ def get_right_monitor() -> Optional[Dict]:
     Returns:
         Monitor dictionary or None
     """
-    selector = MonitorSelector()
-    monitors = selector.get_monitors()
+    monitors = _get_shared_selector().get_monitors()
 
     if not monitors:
         return None
@@ -3,16 +3,71 @@ Privacy and PII masking utilities
 Provides data minimization and PII detection/masking for responsible AI
 """
 
-from typing import Dict, List, Set, Optional, Any, Tuple
+from typing import Callable, Dict, List, Set, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 import re
 import hashlib
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 from config.settings import PII_COLUMNS_KEYWORDS, MASK_PII
 
+class _DigitFilter(dict):
+    """str.translate table that deletes every non-digit character"""
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        # Same digit set as regex \d: Unicode decimal digits
+        result = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = result
+        return result
+
+
+_DIGIT_FILTER = _DigitFilter()
+
+
+def _digits_only(value: str) -> str:
+    """Strip all non-digit characters from a string"""
+    if value.isdecimal():
+        return value
+    return value.translate(_DIGIT_FILTER)
+
+# Empty SHA-256 context; copy() clones its initialized state, which is
+# cheaper than constructing a new hash object per value
+_SHA256_PROTOTYPE = hashlib.sha256()
+
+
+# Pattern-detection decisions keyed on (column, dtype, sample digest).
+# Only the digest and the decision are held, never the sampled values.
+_PATTERN_DECISIONS: "OrderedDict[tuple, Optional[str]]" = OrderedDict()
+_PATTERN_DECISIONS_MAXSIZE = 1024
+
+
+def _sample_digest(values: List[str]) -> bytes:
+    """Length-prefixed BLAKE2b fingerprint of sampled string values"""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        encoded = value.encode('utf-8', 'surrogatepass')
+        digest.update(len(encoded).to_bytes(4, 'little'))
+        digest.update(encoded)
+    return digest.digest()
+
+
+def _to_str_list(series: pd.Series) -> List[str]:
+    """Convert a Series to a plain list of strings"""
+    # Object columns are mostly str already, and str() returns those
+    # unchanged without building an intermediate Series
+    if series.dtype == object:
+        return list(map(str, series.tolist()))
+    return series.astype(str).tolist()
+
 
 @dataclass
 class PIIReport:
@@ -34,15 +89,41 @@ class PIIReport:
         }
 
 
+class _MaskStrings(dict):
+    """Mask strings keyed by length, built on first use"""
+
+    def __init__(self, mask_char: str):
+        super().__init__()
+        self.mask_char = mask_char
+
+    def __missing__(self, length: int) -> str:
+        result = self.mask_char * length
+        self[length] = result
+        return result
+
+
 class PIIDetector:
     """Detect personally identifiable information in DataFrames"""
 
-    # Common PII patterns (regex)
-    EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    PHONE_PATTERN = r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b'
-    SSN_PATTERN = r'\b\d{3}-\d{2}-\d{4}\b'
-    CREDIT_CARD_PATTERN = r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'
-    IP_ADDRESS_PATTERN = r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'
+    # Common PII patterns (regex), compiled once at class load
+    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    PHONE_PATTERN = re.compile(r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b')
+    SSN_PATTERN = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
+    CREDIT_CARD_PATTERN = re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b')
+    IP_ADDRESS_PATTERN = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b')
+
+    # Every pattern above needs an '@' or a digit, so a value with neither
+    # is a miss for all of them after one cheap scan
+    CANDIDATE_PATTERN = re.compile(r'[@\d]')
+
+    # (detection method, pattern, minimum match rate) in priority order
+    PATTERN_CHECKS = (
+        ('email_pattern', EMAIL_PATTERN, 0.5),
+        ('phone_pattern', PHONE_PATTERN, 0.5),
+        ('ssn_pattern', SSN_PATTERN, 0.5),
+        ('credit_card_pattern', CREDIT_CARD_PATTERN, 0.3),
+        ('ip_address_pattern', IP_ADDRESS_PATTERN, 0.5),
+    )
 
     def __init__(self, keywords: List[str] = None):
         """
@@ -53,6 +134,11 @@ class PIIDetector:
         """
         self.keywords = keywords or PII_COLUMNS_KEYWORDS
 
+        # All keywords in one alternation so each column name is scanned once
+        self._keyword_pattern = re.compile(
+            '|'.join(re.escape(keyword.lower()) for keyword in self.keywords)
+        )
+
     def detect_pii_columns(self, df: pd.DataFrame) -> PIIReport:
         """
         Detect columns containing PII
@@ -75,7 +161,10 @@ class PIIDetector:
                 continue
 
             # Check 2: Content pattern analysis (sample first 100 non-null values)
-            sample = df[col].dropna().head(100)
+            if self._cannot_hold_pii_text(df[col].dtype):
+                continue
+
+            sample = self._sample_non_null(df[col], 100)
             if len(sample) == 0:
                 continue
 
@@ -86,66 +175,183 @@ class PIIDetector:
 
         return report
 
+    @staticmethod
+    def _cannot_hold_pii_text(dtype) -> bool:
+        """
+        Check whether a dtype's values can never render as a PII pattern
+
+        Integer and float columns are still scanned: phone and card
+        numbers are often stored numerically (as floats when nulls exist).
+        """
+        return (
+            pd.api.types.is_bool_dtype(dtype)
+            or pd.api.types.is_datetime64_any_dtype(dtype)
+            or pd.api.types.is_timedelta64_dtype(dtype)
+        )
+
+    @staticmethod
+    def _sample_non_null(series: pd.Series, n: int) -> pd.Series:
+        """
+        Get the first n non-null values without scanning the whole column
+
+        Args:
+            series: Column to sample
+            n: Number of non-null values wanted
+
+        Returns:
+            Series of up to n non-null values, in column order
+        """
+        window = 2 * n
+        sample = series.head(window).dropna().head(n)
+
+        # Sparse column: keep reading in geometrically growing chunks and
+        # stop as soon as enough values are collected
+        start = window
+        while len(sample) < n and start < len(series):
+            window *= 2
+            chunk = series.iloc[start:start + window].dropna()
+            sample = pd.concat([sample, chunk]).head(n)
+            start += window
+
+        return sample
+
     def _matches_keyword(self, col_name: str) -> bool:
         """Check if column name matches PII keywords"""
-        for keyword in self.keywords:
-            if keyword.lower() in col_name:
-                return True
-        return False
+        return self._keyword_pattern.search(col_name) is not None
 
     def _detect_pii_pattern(self, series: pd.Series) -> Optional[str]:
         """
         Detect PII patterns in series content
 
+        All patterns are tested in a single pass over the sample. Each
+        pattern is settled as soon as its threshold is certain to be met or
+        missed, and the scan stops once the highest-priority unsettled
+        pattern is known.
+
         Args:
             series: Series to analyze
 
         Returns:
             Detection method string if PII found, None otherwise
         """
-        # Convert to strings
-        str_series = series.astype(str)
-
-        # Email detection
-        if self._pattern_match_rate(str_series, self.EMAIL_PATTERN) > 0.5:
-            return 'email_pattern'
-
-        # Phone detection
-        if self._pattern_match_rate(str_series, self.PHONE_PATTERN) > 0.5:
-            return 'phone_pattern'
-
-        # SSN detection
-        if self._pattern_match_rate(str_series, self.SSN_PATTERN) > 0.5:
-            return 'ssn_pattern'
-
-        # Credit card detection
-        if self._pattern_match_rate(str_series, self.CREDIT_CARD_PATTERN) > 0.3:
-            return 'credit_card_pattern'
-
-        # IP address detection
-        if self._pattern_match_rate(str_series, self.IP_ADDRESS_PATTERN) > 0.5:
-            return 'ip_address_pattern'
+        values = _to_str_list(series)
+        if not values:
+            return None
+
+        # Repeated scans of the same data (e.g. masking after an explicit
+        # detection pass) reuse the decision. The key is a digest of the
+        # sample, so no raw PII is retained in the process-wide cache.
+        key = (
+            series.name,
+            str(series.dtype),
+            _sample_digest(values),
+            self.PATTERN_CHECKS,
+            self.CANDIDATE_PATTERN
+        )
+        try:
+            _PATTERN_DECISIONS.move_to_end(key)
+            return _PATTERN_DECISIONS[key]
+        except KeyError:
+            pass
+
+        result = self._match_patterns(values, self.PATTERN_CHECKS, self.CANDIDATE_PATTERN)
+        _PATTERN_DECISIONS[key] = result
+        if len(_PATTERN_DECISIONS) > _PATTERN_DECISIONS_MAXSIZE:
+            _PATTERN_DECISIONS.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _match_patterns(
+        values: List[str],
+        checks: tuple,
+        candidate: re.Pattern
+    ) -> Optional[str]:
+        """Return the first pattern check in priority order that values pass"""
+        total = len(values)
+        needed = [PIIDetector._hits_needed(threshold, total) for _, _, threshold in checks]
+        hits = [0] * len(checks)
+        misses = [0] * len(checks)
+        # None while undecided, then True/False
+        decided = [None if need <= total else False for need in needed]
+
+        for value in values:
+            is_candidate = candidate.search(value) is not None
+            for i, (_, pattern, _) in enumerate(checks):
+                if decided[i] is not None:
+                    continue
+                if is_candidate and pattern.search(value):
+                    hits[i] += 1
+                    if hits[i] >= needed[i]:
+                        decided[i] = True
+                else:
+                    misses[i] += 1
+                    if total - misses[i] < needed[i]:
+                        decided[i] = False
+
+            for (method, _, _), outcome in zip(checks, decided):
+                if outcome is None:
+                    break
+                if outcome:
+                    return method
+            else:
+                return None
 
         return None
 
-    def _pattern_match_rate(self, series: pd.Series, pattern: str) -> float:
-        """Calculate percentage of values matching a pattern"""
-        matches = series.str.contains(pattern, regex=True, na=False).sum()
-        total = len(series)
-        return matches / total if total > 0 else 0.0
+    @staticmethod
+    def _hits_needed(threshold: float, total: int) -> int:
+        """Smallest match count whose rate over total exceeds threshold"""
+        need = int(threshold * total) + 1
+        # Correct for float rounding in threshold * total
+        while need > 1 and (need - 1) / total > threshold:
+            need -= 1
+        while need / total <= threshold:
+            need += 1
+        return need
 
 
 class PIIMasker:
     """Mask personally identifiable information"""
 
-    def __init__(self, mask_char: str = '*'):
+    # Per-value helper for each in-place masking method
+    _SCALAR_MASKS = {
+        'partial': '_partial_mask',
+        'full': '_full_mask',
+        'hash': '_hash_value'
+    }
+
+    HASH_ALGORITHMS = ('sha256', 'xxh3')
+
+    def __init__(self, mask_char: str = '*', hash_algorithm: str = 'sha256'):
         """
         Initialize PII masker
 
         Args:
             mask_char: Character to use for masking
+            hash_algorithm: Digest for the 'hash' method - 'sha256'
+                (truncated, cryptographic) or 'xxh3' (faster, not
+                cryptographic; requires xxhash)
         """
+        if hash_algorithm not in self.HASH_ALGORITHMS:
+            raise ValueError(f"Unknown hash algorithm: {hash_algorithm}")
+
+        if hash_algorithm == 'xxh3' and not XXHASH_AVAILABLE:
+            raise ImportError(
+                "xxhash is required for hash_algorithm='xxh3'. "
+                "Install with: pip install xxhash"
+            )
+
         self.mask_char = mask_char
+        self.hash_algorithm = hash_algorithm
+
+        # Shared mask strings by length, so masking a column reuses one
+        # string object per distinct length instead of allocating per row
+        self._masks = _MaskStrings(mask_char)
+
+        # Per-value maskers specialized for this mask_char: closures read
+        # the mask cache as a local instead of through self on every call
+        self._partial_mask = self._make_partial_masker(self._masks)
+        self._full_mask = self._make_full_masker(self._masks)
 
     def mask_dataframe(
         self,
@@ -164,7 +370,9 @@ class PIIMasker:
         Returns:
             Tuple of (masked DataFrame, PIIReport)
         """
-        df_masked = df.copy()
+        # Shallow copy: masked columns are replaced wholesale below, so the
+        # untouched columns can share data with the input
+        df_masked = df.copy(deep=False)
         report = PIIReport()
 
         # Auto-detect PII if not specified
@@ -182,64 +390,146 @@ class PIIMasker:
             if col not in df.columns:
                 continue
 
-            original_null_count = df_masked[col].isnull().sum()
-
-            if method == 'partial':
-                df_masked[col] = df_masked[col].apply(self._partial_mask)
+            # One null scan per column, shared by the masking kernel and the
+            # report count
+            not_null = df_masked[col].notna().to_numpy()
+            values_masked = int(not_null.sum())
+
+            if method in self._SCALAR_MASKS and isinstance(df_masked[col].dtype, pd.CategoricalDtype):
+                # Mask each distinct category once instead of every row
+                scalar_mask = getattr(self, self._SCALAR_MASKS[method])
+                df_masked[col] = self._mask_categories(df_masked[col], scalar_mask)
+            elif method == 'partial':
+                df_masked[col] = self._partial_mask_series(df_masked[col], not_null)
             elif method == 'full':
-                df_masked[col] = df_masked[col].apply(self._full_mask)
+                df_masked[col] = self._full_mask_series(df_masked[col], not_null)
             elif method == 'hash':
-                df_masked[col] = df_masked[col].apply(self._hash_value)
+                df_masked[col] = self._hash_series(df_masked[col], not_null)
             elif method == 'remove':
                 df_masked = df_masked.drop(columns=[col])
                 report.masked_columns.append(col)
-                report.total_values_masked[col] = len(df) - original_null_count
+                report.total_values_masked[col] = values_masked
                 continue
             else:
                 raise ValueError(f"Unknown masking method: {method}")
 
             report.masked_columns.append(col)
-            report.total_values_masked[col] = len(df) - original_null_count
+            report.total_values_masked[col] = values_masked
 
         return df_masked, report
 
-    def _partial_mask(self, value: Any) -> str:
-        """Partially mask a value (show first/last chars)"""
-        if pd.isna(value):
-            return value
+    def _partial_mask_series(self, series: pd.Series, not_null: np.ndarray) -> pd.Series:
+        """Column-at-once equivalent of applying _partial_mask to a column"""
+        masks = self._masks
+
+        # Values of 4 chars or fewer are fully masked, longer ones keep
+        # their first 2 and last 2 characters
+        masked = [
+            value[:2] + masks[n - 4] + value[-2:] if (n := len(value)) > 4
+            else masks[n]
+            for value in _to_str_list(series[not_null])
+        ]
+
+        return self._with_nulls_restored(series, not_null, masked)
+
+    def _full_mask_series(self, series: pd.Series, not_null: np.ndarray) -> pd.Series:
+        """Column-at-once equivalent of applying _full_mask to a column"""
+        masks = self._masks
+        masked = [masks[len(value)] for value in _to_str_list(series[not_null])]
+
+        return self._with_nulls_restored(series, not_null, masked)
+
+    def _hash_series(self, series: pd.Series, not_null: np.ndarray) -> pd.Series:
+        """Column-at-once equivalent of applying _hash_value to a column"""
+        if self.hash_algorithm == 'xxh3':
+            digest = xxhash.xxh3_64_hexdigest
+            hashed = [digest(value.encode()) for value in _to_str_list(series[not_null])]
+            return self._with_nulls_restored(series, not_null, hashed)
+
+        new_context = _SHA256_PROTOTYPE.copy
+        hashed = []
+        append = hashed.append
+        for value in _to_str_list(series[not_null]):
+            context = new_context()
+            context.update(value.encode())
+            append(context.hexdigest()[:16])
+
+        return self._with_nulls_restored(series, not_null, hashed)
+
+    @staticmethod
+    def _mask_categories(series: pd.Series, scalar_mask) -> pd.Series:
+        """Mask a categorical column by masking each category once"""
+        masked_codes, masked_categories = pd.factorize(np.array(
+            [scalar_mask(category) for category in series.cat.categories],
+            dtype=object
+        ))
+        # Masking can merge categories, so remap codes; -1 (null) stays -1
+        codes = np.append(masked_codes, -1)[series.cat.codes.to_numpy()]
+
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=masked_categories),
+            index=series.index,
+            name=series.name
+        )
 
-        str_value = str(value)
-        length = len(str_value)
+    @staticmethod
+    def _with_nulls_restored(
+        series: pd.Series,
+        not_null: np.ndarray,
+        masked: List[str]
+    ) -> pd.Series:
+        """Place masked values back into a copy of series, keeping nulls as-is"""
+        values = series.to_numpy(dtype=object, copy=True)
+        values[not_null] = np.fromiter(masked, dtype=object, count=len(masked))
+        return pd.Series(values, index=series.index, name=series.name)
 
-        if length <= 4:
-            # Too short, full mask
-            return self.mask_char * length
+    @staticmethod
+    def _make_partial_masker(masks: '_MaskStrings') -> Callable[[Any], Any]:
+        """Build _partial_mask with this masker's mask strings bound as locals"""
+        isna = pd.isna
 
-        # Show first 2 and last 2 characters
-        visible_chars = 2
-        masked_length = length - (2 * visible_chars)
+        def _partial_mask(value: Any) -> str:
+            """Partially mask a value (show first/last chars)"""
+            if isna(value):
+                return value
 
-        return (
-            str_value[:visible_chars] +
-            self.mask_char * masked_length +
-            str_value[-visible_chars:]
-        )
+            str_value = str(value)
+            length = len(str_value)
 
-    def _full_mask(self, value: Any) -> str:
-        """Fully mask a value"""
-        if pd.isna(value):
-            return value
+            if length <= 4:
+                # Too short, full mask
+                return masks[length]
 
-        str_value = str(value)
-        return self.mask_char * len(str_value)
+            # Show first 2 and last 2 characters
+            return str_value[:2] + masks[length - 4] + str_value[-2:]
+
+        return _partial_mask
+
+    @staticmethod
+    def _make_full_masker(masks: '_MaskStrings') -> Callable[[Any], Any]:
+        """Build _full_mask with this masker's mask strings bound as locals"""
+        isna = pd.isna
+
+        def _full_mask(value: Any) -> str:
+            """Fully mask a value"""
+            if isna(value):
+                return value
+
+            return masks[len(str(value))]
+
+        return _full_mask
 
     def _hash_value(self, value: Any) -> str:
-        """Hash a value using SHA256"""
+        """Hash a value using the configured hash algorithm"""
         if pd.isna(value):
             return value
 
         str_value = str(value)
-        hash_obj = hashlib.sha256(str_value.encode())
+        if self.hash_algorithm == 'xxh3':
+            return xxhash.xxh3_64_hexdigest(str_value.encode())
+
+        hash_obj = _SHA256_PROTOTYPE.copy()
+        hash_obj.update(str_value.encode())
         return hash_obj.hexdigest()[:16]  # Truncate for readability
 
     def mask_email(self, email: str) -> str:
@@ -267,7 +557,7 @@ class PIIMasker:
             return phone
 
         # Remove non-digits
-        digits = re.sub(r'\D', '', str(phone))
+        digits = _digits_only(str(phone))
 
         if len(digits) < 4:
             return self.mask_char * len(digits)
@@ -289,7 +579,7 @@ class PIIMasker:
                 return f"{self.mask_char * 3}-{self.mask_char * 2}-{parts[2]}"
 
         # Plain digits
-        digits = re.sub(r'\D', '', str_ssn)
+        digits = _digits_only(str_ssn)
         if len(digits) >= 4:
             return self.mask_char * (len(digits) - 4) + digits[-4:]
 
@@ -301,7 +591,7 @@ class PIIMasker:
             return card
 
         # Remove non-digits
-        digits = re.sub(r'\D', '', str(card))
+        digits = _digits_only(str(card))
 
         if len(digits) < 4:
             return self.mask_char * len(digits)
@@ -390,10 +680,15 @@ class DataMinimizer:
                 break
 
         if stratify_col:
-            # Stratified sample
-            return df.groupby(stratify_col, group_keys=False).apply(
-                lambda x: x.sample(min(len(x), max(1, n_samples // df[stratify_col].nunique())), random_state=42)
-            ).head(n_samples)
+            # Stratified sample: draw row positions per group directly
+            groups = df.groupby(stratify_col, sort=False).indices
+            per_group = max(1, n_samples // len(groups))
+            rng = np.random.default_rng(42)
+            picks = np.concatenate([
+                rng.choice(positions, size=min(per_group, len(positions)), replace=False)
+                for positions in groups.values()
+            ])
+            return df.iloc[picks[:n_samples]]
         else:
             # Fallback to random sample
             return df.sample(n=min(n_samples, len(df)), random_state=42)
@@ -2,11 +2,21 @@
 Report generation utilities
 Create PDF and HTML reports from analysis results
 """
+import asyncio
+import json
+import os
+import tarfile
+import tempfile
+import time
+import zipfile
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+from io import BytesIO, TextIOWrapper
 import base64
 
 # PDF generation
@@ -18,219 +28,52 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
 # HTML templates
-from jinja2 import Template
-
-from config.settings import EXPORTS_DIR, PDF_PAGE_SIZE
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+from markupsafe import escape
+
+# Optional: HTML-to-PDF rendering
+try:
+    import weasyprint
+    WEASYPRINT_AVAILABLE = True
+except (ImportError, OSError):
+    # OSError: weasyprint installed but its native libraries are missing
+    WEASYPRINT_AVAILABLE = False
+
+# Optional: fast JSON encoder for anomaly sidecar files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: fast CSV writer for batch exports
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional: multi-threaded zstd compression for large batch exports
+try:
+    import zstandard as zstd
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
+
+from config.settings import CACHE_DIR, EXPORTS_DIR, PDF_PAGE_SIZE
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class ReportGenerator:
-    """Generate analysis reports in multiple formats"""
-
-    def __init__(self, exports_dir: Path = EXPORTS_DIR):
-        """
-        Initialize report generator
-
-        Args:
-            exports_dir: Directory for exported reports
-        """
-        self.exports_dir = exports_dir
-        self.exports_dir.mkdir(exist_ok=True)
-        logger.info(f"Report generator initialized: {exports_dir}")
-
-    def generate_pdf_report(
-        self,
-        filename: str,
-        title: str,
-        data_summary: Dict,
-        quality_score: Optional[Dict] = None,
-        statistical_analysis: Optional[Dict] = None,
-        anomalies: Optional[List] = None,
-        visualizations: Optional[List] = None
-    ) -> Path:
-        """
-        Generate PDF report
-
-        Args:
-            filename: Output filename
-            title: Report title
-            data_summary: Data summary dictionary
-            quality_score: Quality score results
-            statistical_analysis: Statistical analysis results
-            anomalies: List of detected anomalies
-            visualizations: Visualization suggestions
-
-        Returns:
-            Path to generated PDF
-        """
-        pdf_path = self.exports_dir / f"{filename}.pdf"
-        doc = SimpleDocTemplate(
-            str(pdf_path),
-            pagesize=A4 if PDF_PAGE_SIZE == "A4" else letter,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
-        )
-
-        # Container for the 'Flowable' objects
-        elements = []
-
-        # Styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a1a1a'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#2c3e50'),
-            spaceAfter=12,
-            spaceBefore=12
-        )
-
-        # Title
-        elements.append(Paragraph(title, title_style))
-        elements.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-        elements.append(Spacer(1, 0.3*inch))
-
-        # Data Summary Section
-        elements.append(Paragraph("Data Summary", heading_style))
-        summary_data = [
-            ['Metric', 'Value'],
-            ['File Size', f"{data_summary.get('file_size_mb', 'N/A')} MB"],
-            ['Rows', f"{data_summary.get('rows', 0):,}"],
-            ['Columns', f"{data_summary.get('columns', 0)}"],
-        ]
-
-        summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        elements.append(summary_table)
-        elements.append(Spacer(1, 0.3*inch))
-
-        # Quality Score Section
-        if quality_score:
-            elements.append(Paragraph("Data Quality Assessment", heading_style))
-
-            # Overall score
-            overall_score = quality_score.get('overall_score', 0)
-            grade = quality_score.get('grade', 'N/A')
-            rating = quality_score.get('rating', 'N/A')
-
-            score_text = f"<b>Overall Score:</b> {overall_score:.1f}/100 (Grade: {grade} - {rating})"
-            elements.append(Paragraph(score_text, styles['Normal']))
-            elements.append(Spacer(1, 0.2*inch))
-
-            # Dimension scores
-            dimension_scores = quality_score.get('dimension_scores', {})
-            score_data = [['Dimension', 'Score']]
-            for dimension, score in dimension_scores.items():
-                score_data.append([dimension.capitalize(), f"{score:.1f}"])
-
-            score_table = Table(score_data, colWidths=[3*inch, 2*inch])
-            score_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ecc71')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            elements.append(score_table)
-            elements.append(Spacer(1, 0.2*inch))
-
-            # Recommendations
-            recommendations = quality_score.get('recommendations', [])
-            if recommendations:
-                elements.append(Paragraph("<b>Recommendations:</b>", styles['Normal']))
-                for rec in recommendations:
-                    elements.append(Paragraph(f"• {rec}", styles['Normal']))
-
-            elements.append(Spacer(1, 0.3*inch))
-
-        # Anomalies Section
-        if anomalies:
-            elements.append(Paragraph("Detected Anomalies", heading_style))
-
-            for anomaly in anomalies[:20]:  # Limit to 20
-                severity = anomaly.get('severity', 'unknown')
-                description = anomaly.get('description', 'No description')
-                elements.append(Paragraph(f"<b>[{severity.upper()}]</b> {description}", styles['Normal']))
-
-            elements.append(Spacer(1, 0.3*inch))
-
-        # Visualizations Section
-        if visualizations:
-            elements.append(Paragraph("Recommended Visualizations", heading_style))
-
-            for viz in visualizations[:10]:  # Limit to 10
-                viz_type = viz.get('viz_type', 'Unknown')
-                use_case = viz.get('use_case', '')
-                description = viz.get('description', '')
-
-                elements.append(Paragraph(f"<b>{viz_type}</b> - {use_case}", styles['Normal']))
-                elements.append(Paragraph(description, styles['Normal']))
-                elements.append(Spacer(1, 0.1*inch))
-
-        # Build PDF
-        try:
-            doc.build(elements)
-            logger.info(f"PDF report generated: {pdf_path}")
-            return pdf_path
-        except Exception as e:
-            logger.error(f"Failed to generate PDF: {e}")
-            raise
-
-    def generate_html_report(
-        self,
-        filename: str,
-        title: str,
-        data_summary: Dict,
-        quality_score: Optional[Dict] = None,
-        statistical_analysis: Optional[Dict] = None,
-        anomalies: Optional[List] = None,
-        visualizations: Optional[List] = None
-    ) -> Path:
-        """
-        Generate HTML report
-
-        Args:
-            filename: Output filename
-            title: Report title
-            data_summary: Data summary dictionary
-            quality_score: Quality score results
-            statistical_analysis: Statistical analysis results
-            anomalies: List of detected anomalies
-            visualizations: Visualization suggestions
-
-        Returns:
-            Path to generated HTML
-        """
-        html_template = """
+HTML_HEAD_STR = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ title }}</title>
+    <title>{title}</title>
     <style>
         * {
             margin: 0;
@@ -420,53 +263,17 @@ class ReportGenerator:
 </head>
 <body>
     <div class="container">
-        <h1>{{ title }}</h1>
-        <p class="meta">Generated: {{ timestamp }}</p>
-
-        <h2>Data Summary</h2>
-        <div class="summary-grid">
-            <div class="summary-card">
-                <div class="label">File Size</div>
-                <div class="value">{{ data_summary.get('file_size_mb', 'N/A') }} MB</div>
-            </div>
-            <div class="summary-card">
-                <div class="label">Rows</div>
-                <div class="value">{{ "{:,}".format(data_summary.get('rows', 0)) }}</div>
-            </div>
-            <div class="summary-card">
-                <div class="label">Columns</div>
-                <div class="value">{{ data_summary.get('columns', 0) }}</div>
-            </div>
-        </div>
-
-        {% if quality_score %}
-        <h2>Data Quality Assessment</h2>
-        <div class="quality-score">
-            <div class="score">{{ "%.1f"|format(quality_score.get('overall_score', 0)) }}</div>
-            <div class="grade">Grade: {{ quality_score.get('grade', 'N/A') }} - {{ quality_score.get('rating', 'N/A') }}</div>
-        </div>
-
-        <h3>Dimension Scores</h3>
-        <div class="dimension-scores">
-            {% for dimension, score in quality_score.get('dimension_scores', {}).items() %}
-            <div class="dimension-card">
-                <div class="name">{{ dimension }}</div>
-                <div class="score">{{ "%.1f"|format(score) }}</div>
-            </div>
-            {% endfor %}
-        </div>
-
-        {% if quality_score.get('recommendations') %}
-        <h3>Recommendations</h3>
-        {% for rec in quality_score.get('recommendations', []) %}
-        <div class="recommendation">{{ rec }}</div>
-        {% endfor %}
-        {% endif %}
-        {% endif %}
+"""
 
+# Dynamic, list-driven sections of the report; the fixed-schema header and
+# summary above them are written directly by _render_summary
+HTML_SECTIONS_TEMPLATE_STR = """
         {% if anomalies %}
         <h2>Detected Anomalies</h2>
-        {% for anomaly in anomalies[:20] %}
+        {% if anomaly_sidecar %}
+        <p class="meta">Showing {{ anomalies|length }} of {{ anomaly_total }} anomalies. <a href="{{ anomaly_sidecar }}">Full anomaly list</a></p>
+        {% endif %}
+        {% for anomaly in anomalies %}
         <div class="anomaly {{ anomaly.get('severity', 'low') }}">
             <strong>[{{ anomaly.get('severity', 'unknown').upper() }}]</strong> {{ anomaly.get('description', 'No description') }}
         </div>
@@ -475,7 +282,7 @@ class ReportGenerator:
 
         {% if visualizations %}
         <h2>Recommended Visualizations</h2>
-        {% for viz in visualizations[:10] %}
+        {% for viz in visualizations %}
         <div class="viz-card">
             <div class="viz-type">{{ viz.get('viz_type', 'Unknown') }}</div>
             <div class="use-case">{{ viz.get('use_case', '') }}</div>
@@ -488,52 +295,781 @@ class ReportGenerator:
 </html>
 """
 
-        template = Template(html_template)
-        html_content = template.render(
-            title=title,
-            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            data_summary=data_summary,
-            quality_score=quality_score,
-            statistical_analysis=statistical_analysis,
-            anomalies=anomalies,
-            visualizations=visualizations
+_HTML_HEAD_BEFORE_TITLE, _HTML_HEAD_AFTER_TITLE = HTML_HEAD_STR.split('{title}')
+_HTML_FOOT = """    </div>
+</body>
+</html>
+"""
+
+# Report sections list at most this many entries
+MAX_REPORT_ANOMALIES = 20
+MAX_REPORT_VISUALIZATIONS = 10
+
+# Batches with at least this many files serialise their CSVs in worker processes
+PARALLEL_ZIP_MIN_FILES = 4
+
+# Batch archive formats; ZIPs above the size threshold are stored uncompressed
+BATCH_ARCHIVE_FORMATS = ('zip', 'tzst')
+ZIP_STORED_THRESHOLD_BYTES = 128 << 20
+
+
+@lru_cache(maxsize=1)
+def _html_sections_template():
+    """
+    Get the compiled HTML sections template, building it on first render
+
+    The template is loaded by name (not from_string) so the compiled
+    bytecode is persisted under CACHE_DIR and later processes skip the
+    parse/compile step. Nothing is created on disk until a report is
+    actually rendered.
+
+    Returns:
+        Compiled jinja2 Template
+    """
+    jinja_cache_dir = CACHE_DIR / "jinja"
+    jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+    env = Environment(
+        loader=DictLoader({'report_sections.html': HTML_SECTIONS_TEMPLATE_STR}),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=64,
+        bytecode_cache=FileSystemBytecodeCache(str(jinja_cache_dir), '__jinja2_%s.cache')
+    )
+    return env.get_template('report_sections.html')
+
+
+# PDF styles are immutable configuration, built once and shared by every report
+_DARK = colors.HexColor('#1a1a1a')
+_HEADING_COLOR = colors.HexColor('#2c3e50')
+_BLUE = colors.HexColor('#3498db')
+_GREEN = colors.HexColor('#2ecc71')
+
+_STYLES = getSampleStyleSheet()
+_NORMAL_STYLE = _STYLES['Normal']
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=_DARK,
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    textColor=_HEADING_COLOR,
+    spaceAfter=12,
+    spaceBefore=12
+)
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _BLUE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+_SCORE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _GREEN),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+_LIST_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('LINEBELOW', (0, 0), (-1, -1), 0.25, colors.lightgrey)
+])
+
+
+def _build_pdf(
+    title: str,
+    timestamp: str,
+    data_summary: Dict,
+    quality_score: Optional[Dict],
+    anomalies: List,
+    visualizations: List,
+    anomaly_total: int = 0,
+    anomaly_sidecar: Optional[str] = None
+) -> bytes:
+    """
+    Lay out the PDF report
+
+    Args:
+        title: Report title
+        timestamp: Generation timestamp
+        data_summary: Data summary dictionary
+        quality_score: Quality score results
+        anomalies: Detected anomalies (already truncated)
+        visualizations: Visualization suggestions (already truncated)
+        anomaly_total: Number of anomalies before truncation
+        anomaly_sidecar: Name of the JSON file holding the full anomaly list
+
+    Returns:
+        PDF document bytes
+    """
+    # Render into memory and write the file in one go, rather than
+    # letting reportlab issue many small writes
+    pdf_buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        pdf_buffer,
+        pagesize=A4 if PDF_PAGE_SIZE == "A4" else letter,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch
+    )
+
+    # Container for the 'Flowable' objects
+    elements = []
+
+    title_style = _TITLE_STYLE
+    heading_style = _HEADING_STYLE
+    normal_style = _NORMAL_STYLE
+
+    # Title
+    elements.append(Paragraph(title, title_style))
+    elements.append(Paragraph(f"Generated: {timestamp}", normal_style))
+    elements.append(Spacer(1, 0.3*inch))
+
+    # Data Summary Section
+    elements.append(Paragraph("Data Summary", heading_style))
+    summary_data = [
+        ['Metric', 'Value'],
+        ['File Size', f"{data_summary.get('file_size_mb', 'N/A')} MB"],
+        ['Rows', f"{data_summary.get('rows', 0):,}"],
+        ['Columns', f"{data_summary.get('columns', 0)}"],
+    ]
+
+    summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
+    summary_table.setStyle(_SUMMARY_TABLE_STYLE)
+    elements.append(summary_table)
+    elements.append(Spacer(1, 0.3*inch))
+
+    # Quality Score Section
+    if quality_score:
+        elements.append(Paragraph("Data Quality Assessment", heading_style))
+
+        # Overall score
+        overall_score = quality_score.get('overall_score', 0)
+        grade = quality_score.get('grade', 'N/A')
+        rating = quality_score.get('rating', 'N/A')
+
+        score_text = f"<b>Overall Score:</b> {overall_score:.1f}/100 (Grade: {grade} - {rating})"
+        elements.append(Paragraph(score_text, normal_style))
+        elements.append(Spacer(1, 0.2*inch))
+
+        # Dimension scores
+        score_data = [['Dimension', 'Score']]
+        score_data.extend(
+            [dimension, score]
+            for dimension, score in _format_dimension_scores(quality_score.get('dimension_scores', {}))
         )
 
+        score_table = Table(score_data, colWidths=[3*inch, 2*inch])
+        score_table.setStyle(_SCORE_TABLE_STYLE)
+        elements.append(score_table)
+        elements.append(Spacer(1, 0.2*inch))
+
+        # Recommendations
+        recommendations = quality_score.get('recommendations', [])
+        if recommendations:
+            elements.append(Paragraph("<b>Recommendations:</b>", normal_style))
+            for rec in recommendations:
+                elements.append(Paragraph(f"• {rec}", normal_style))
+
+        elements.append(Spacer(1, 0.3*inch))
+
+    # Anomalies Section
+    if anomalies:
+        elements.append(Paragraph("Detected Anomalies", heading_style))
+        if anomaly_sidecar:
+            elements.append(Paragraph(
+                f"Showing {len(anomalies)} of {anomaly_total} anomalies. "
+                f"Full list: <a href=\"{escape(anomaly_sidecar)}\" color=\"blue\">{escape(anomaly_sidecar)}</a>",
+                normal_style
+            ))
+
+        # One table lays out far faster than a flowable per anomaly
+        anomaly_rows = [
+            [
+                Paragraph(f"<b>[{anomaly.get('severity', 'unknown').upper()}]</b>", normal_style),
+                Paragraph(anomaly.get('description', 'No description'), normal_style)
+            ]
+            for anomaly in anomalies
+        ]
+        elements.append(Table(
+            anomaly_rows,
+            colWidths=[1*inch, 5*inch],
+            style=_LIST_TABLE_STYLE
+        ))
+        elements.append(Spacer(1, 0.3*inch))
+
+    # Visualizations Section
+    if visualizations:
+        elements.append(Paragraph("Recommended Visualizations", heading_style))
+
+        viz_rows = [
+            [
+                Paragraph(f"<b>{viz.get('viz_type', 'Unknown')}</b>", normal_style),
+                Paragraph(f"{viz.get('use_case', '')}<br/>{viz.get('description', '')}", normal_style)
+            ]
+            for viz in visualizations
+        ]
+        elements.append(Table(
+            viz_rows,
+            colWidths=[1.5*inch, 4.5*inch],
+            style=_LIST_TABLE_STYLE
+        ))
+
+    doc.build(elements)
+    return pdf_buffer.getvalue()
+
+
+def _format_dimension_scores(dimension_scores: Dict) -> List[Tuple[str, str]]:
+    """
+    Format dimension scores for display in one vectorized pass
+
+    Args:
+        dimension_scores: Dimension name -> numeric score
+
+    Returns:
+        List of (capitalized name, score formatted to one decimal)
+    """
+    if not dimension_scores:
+        return []
+
+    values = np.fromiter(dimension_scores.values(), dtype=np.float64, count=len(dimension_scores))
+    formatted = np.char.mod('%.1f', values).tolist()
+    return [(name.capitalize(), score) for name, score in zip(dimension_scores, formatted)]
+
+
+def _render_summary(
+    out,
+    title: str,
+    timestamp: str,
+    data_summary: Dict,
+    quality_score: Optional[Dict]
+):
+    """
+    Write the fixed-schema part of the HTML report (title, data summary
+    and quality assessment) directly, without going through Jinja
+
+    Args:
+        out: Text stream to write to
+        title: Report title
+        timestamp: Generation timestamp
+        data_summary: Data summary dictionary
+        quality_score: Quality score results
+    """
+    out.write(
+        f'''        <h1>{escape(title)}</h1>
+        <p class="meta">Generated: {timestamp}</p>
+
+        <h2>Data Summary</h2>
+        <div class="summary-grid">
+            <div class="summary-card">
+                <div class="label">File Size</div>
+                <div class="value">{escape(data_summary.get('file_size_mb', 'N/A'))} MB</div>
+            </div>
+            <div class="summary-card">
+                <div class="label">Rows</div>
+                <div class="value">{data_summary.get('rows', 0):,}</div>
+            </div>
+            <div class="summary-card">
+                <div class="label">Columns</div>
+                <div class="value">{escape(data_summary.get('columns', 0))}</div>
+            </div>
+        </div>
+
+'''
+    )
+
+    if not quality_score:
+        return
+
+    out.write(
+        f'''        <h2>Data Quality Assessment</h2>
+        <div class="quality-score">
+            <div class="score">{quality_score.get('overall_score', 0):.1f}</div>
+            <div class="grade">Grade: {escape(quality_score.get('grade', 'N/A'))} - {escape(quality_score.get('rating', 'N/A'))}</div>
+        </div>
+
+        <h3>Dimension Scores</h3>
+        <div class="dimension-scores">
+'''
+    )
+    for dimension, score in _format_dimension_scores(quality_score.get('dimension_scores', {})):
+        out.write(
+            f'''            <div class="dimension-card">
+                <div class="name">{escape(dimension)}</div>
+                <div class="score">{score}</div>
+            </div>
+'''
+        )
+    out.write('        </div>\n\n')
+
+    recommendations = quality_score.get('recommendations')
+    if recommendations:
+        out.write('        <h3>Recommendations</h3>\n')
+        for rec in recommendations:
+            out.write(f'        <div class="recommendation">{escape(rec)}</div>\n')
+        out.write('\n')
+
+
+def _json_default(obj):
+    """Fallback JSON conversion for NumPy/pandas scalars and other objects"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _arrow_csv_compatible(schema) -> bool:
+    """
+    Check whether pyarrow writes every column of schema the way pandas does
+
+    Arrow renders booleans as true/false and timestamps with nanosecond
+    fractions, and cannot write nested types at all, so only plain
+    numeric and string columns take the fast path.
+    """
+    return all(
+        pa.types.is_integer(field.type)
+        or pa.types.is_floating(field.type)
+        or pa.types.is_string(field.type)
+        or pa.types.is_large_string(field.type)
+        for field in schema
+    )
+
+
+def _write_csv(df: pd.DataFrame, sink) -> None:
+    """
+    Write a DataFrame as UTF-8 CSV to a binary file-like sink
+
+    Uses pyarrow's C++ CSV writer when it is installed and every column
+    is a plain numeric or string type, otherwise falls back to pandas.
+
+    Args:
+        df: DataFrame to write
+        sink: Binary file-like object
+    """
+    if PYARROW_AVAILABLE:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if _arrow_csv_compatible(table.schema):
+                # Render to memory first so a failed write leaves sink untouched
+                buf = pa.BufferOutputStream()
+                pacsv.write_csv(table, buf)
+                sink.write(buf.getvalue().to_pybytes())
+                return
+        except pa.ArrowException:
+            # e.g. object columns mixing types; pandas handles these
+            pass
+
+    text = TextIOWrapper(sink, encoding='utf-8', newline='')
+    df.to_csv(text, index=False)
+    text.flush()
+    text.detach()
+
+
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialise a DataFrame to CSV bytes (runs in a worker process)"""
+    buf = BytesIO()
+    _write_csv(df, buf)
+    return buf.getvalue()
+
+
+def _iter_csv_bytes(files: Dict[str, pd.DataFrame], workers: int):
+    """Yield (filename, csv_bytes) in order, serialising in a process pool if workers > 1"""
+    if workers <= 1:
+        for filename, df in files.items():
+            yield filename, _df_to_csv_bytes(df)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from zip(files, pool.map(_df_to_csv_bytes, files.values()))
+
+
+class ReportGenerator:
+    """Generate analysis reports in multiple formats"""
+
+    def __init__(self, exports_dir: Path = EXPORTS_DIR):
+        """
+        Initialize report generator
+
+        Args:
+            exports_dir: Directory for exported reports
+        """
+        self.exports_dir = exports_dir
+        self.exports_dir.mkdir(exist_ok=True)
+        logger.info(f"Report generator initialized: {exports_dir}")
+
+    def generate_pdf_report(
+        self,
+        filename: str,
+        title: str,
+        data_summary: Dict,
+        quality_score: Optional[Dict] = None,
+        statistical_analysis: Optional[Dict] = None,
+        anomalies: Optional[List] = None,
+        visualizations: Optional[List] = None
+    ) -> Path:
+        """
+        Generate PDF report
+
+        Args:
+            filename: Output filename
+            title: Report title
+            data_summary: Data summary dictionary
+            quality_score: Quality score results
+            statistical_analysis: Statistical analysis results
+            anomalies: List of detected anomalies
+            visualizations: Visualization suggestions
+
+        Returns:
+            Path to generated PDF
+        """
+        anomalies, anomaly_total, anomaly_sidecar = self._truncate_anomalies(filename, anomalies)
+        visualizations = (visualizations or [])[:MAX_REPORT_VISUALIZATIONS]
+
+        pdf_path = self.exports_dir / f"{filename}.pdf"
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        try:
+            pdf_bytes = _build_pdf(
+                title, timestamp, data_summary or {}, quality_score, anomalies, visualizations,
+                anomaly_total, anomaly_sidecar
+            )
+            pdf_path.write_bytes(pdf_bytes)
+            logger.info(f"PDF report generated: {pdf_path}")
+            return pdf_path
+        except Exception as e:
+            logger.error(f"Failed to generate PDF: {e}")
+            raise
+
+    def generate_reports_batch(
+        self,
+        specs: List[Dict],
+        max_workers: Optional[int] = None
+    ) -> List[Path]:
+        """
+        Generate many PDF reports in parallel worker processes
+
+        Report layout is pure Python and holds the GIL, so each PDF is
+        built in its own process.
+
+        Args:
+            specs: Keyword arguments for generate_pdf_report, one dict per report
+            max_workers: Worker processes (default: CPU count)
+
+        Returns:
+            Paths to generated PDFs, in the order of specs
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1 or len(specs) <= 1:
+            return [self.generate_pdf_report(**spec) for spec in specs]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            paths = list(pool.map(
+                _generate_pdf_report_worker,
+                [self.exports_dir] * len(specs),
+                specs
+            ))
+
+        logger.info(f"Batch of {len(paths)} PDF reports generated")
+        return paths
+
+    def generate_html_report(
+        self,
+        filename: str,
+        title: str,
+        data_summary: Dict,
+        quality_score: Optional[Dict] = None,
+        statistical_analysis: Optional[Dict] = None,
+        anomalies: Optional[List] = None,
+        visualizations: Optional[List] = None
+    ) -> Path:
+        """
+        Generate HTML report
+
+        Args:
+            filename: Output filename
+            title: Report title
+            data_summary: Data summary dictionary
+            quality_score: Quality score results
+            statistical_analysis: Statistical analysis results
+            anomalies: List of detected anomalies
+            visualizations: Visualization suggestions
+
+        Returns:
+            Path to generated HTML
+        """
+        anomalies, anomaly_total, anomaly_sidecar = self._truncate_anomalies(filename, anomalies)
+        visualizations = (visualizations or [])[:MAX_REPORT_VISUALIZATIONS]
+
         html_path = self.exports_dir / f"{filename}.html"
         try:
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            self._write_html(
+                html_path, title, data_summary, quality_score, anomalies, visualizations,
+                anomaly_total, anomaly_sidecar
+            )
             logger.info(f"HTML report generated: {html_path}")
             return html_path
         except Exception as e:
             logger.error(f"Failed to generate HTML: {e}")
             raise
 
-    def create_batch_download_zip(self, files: Dict[str, pd.DataFrame], zip_name: str) -> Path:
+    async def generate_html_report_async(
+        self,
+        filename: str,
+        title: str,
+        data_summary: Dict,
+        quality_score: Optional[Dict] = None,
+        statistical_analysis: Optional[Dict] = None,
+        anomalies: Optional[List] = None,
+        visualizations: Optional[List] = None
+    ) -> Path:
+        """
+        Generate HTML report without blocking the event loop
+
+        Args:
+            filename: Output filename
+            title: Report title
+            data_summary: Data summary dictionary
+            quality_score: Quality score results
+            statistical_analysis: Statistical analysis results
+            anomalies: List of detected anomalies
+            visualizations: Visualization suggestions
+
+        Returns:
+            Path to generated HTML
+        """
+        return await asyncio.to_thread(
+            self.generate_html_report,
+            filename,
+            title,
+            data_summary,
+            quality_score,
+            statistical_analysis,
+            anomalies,
+            visualizations
+        )
+
+    async def generate_html_reports_async(self, specs: List[Dict]) -> List[Path]:
+        """
+        Generate many HTML reports concurrently
+
+        Args:
+            specs: Keyword arguments for generate_html_report, one dict per report
+
+        Returns:
+            Paths to generated HTML files, in the order of specs
+        """
+        return list(await asyncio.gather(
+            *(self.generate_html_report_async(**spec) for spec in specs)
+        ))
+
+    def generate_pdf_report_from_html(
+        self,
+        filename: str,
+        title: str,
+        data_summary: Dict,
+        quality_score: Optional[Dict] = None,
+        statistical_analysis: Optional[Dict] = None,
+        anomalies: Optional[List] = None,
+        visualizations: Optional[List] = None
+    ) -> Path:
+        """
+        Generate PDF report by rendering the HTML report with WeasyPrint
+
+        Alternative to generate_pdf_report for large payloads: the HTML is
+        streamed to a temporary file and laid out by WeasyPrint instead of
+        building a reportlab flowable list in memory. The PDF matches the
+        styling of the HTML report.
+
+        Args:
+            filename: Output filename
+            title: Report title
+            data_summary: Data summary dictionary
+            quality_score: Quality score results
+            statistical_analysis: Statistical analysis results
+            anomalies: List of detected anomalies
+            visualizations: Visualization suggestions
+
+        Returns:
+            Path to generated PDF
+        """
+        if not WEASYPRINT_AVAILABLE:
+            raise ImportError("weasyprint not installed. Install with: pip install weasyprint")
+
+        anomalies, anomaly_total, anomaly_sidecar = self._truncate_anomalies(filename, anomalies)
+        visualizations = (visualizations or [])[:MAX_REPORT_VISUALIZATIONS]
+
+        pdf_path = self.exports_dir / f"{filename}.pdf"
+        fd, tmp_name = tempfile.mkstemp(suffix='.html', dir=self.exports_dir)
+        os.close(fd)
+        html_path = Path(tmp_name)
+
+        try:
+            self._write_html(
+                html_path, title, data_summary, quality_score, anomalies, visualizations,
+                anomaly_total, anomaly_sidecar
+            )
+            weasyprint.HTML(filename=str(html_path)).write_pdf(str(pdf_path))
+            logger.info(f"PDF report generated from HTML: {pdf_path}")
+            return pdf_path
+        except Exception as e:
+            logger.error(f"Failed to generate PDF from HTML: {e}")
+            raise
+        finally:
+            html_path.unlink(missing_ok=True)
+
+    def _truncate_anomalies(
+        self,
+        filename: str,
+        anomalies: Optional[List]
+    ) -> Tuple[List, int, Optional[str]]:
+        """
+        Limit anomalies to what the report lists inline
+
+        When the list is longer than MAX_REPORT_ANOMALIES, the full list is
+        written to a JSON sidecar next to the report instead.
+
+        Args:
+            filename: Report filename (without extension)
+            anomalies: List of detected anomalies
+
+        Returns:
+            Tuple of (anomalies to show, total count, sidecar filename or None)
+        """
+        anomalies = anomalies or []
+        total = len(anomalies)
+        if total <= MAX_REPORT_ANOMALIES:
+            return anomalies, total, None
+
+        sidecar_path = self._dump_sidecar(filename, anomalies)
+        return anomalies[:MAX_REPORT_ANOMALIES], total, sidecar_path.name
+
+    def _dump_sidecar(self, filename: str, data) -> Path:
+        """
+        Write data to {filename}.anomalies.json in the exports directory
+
+        Args:
+            filename: Report filename (without extension)
+            data: JSON-serialisable data (NumPy values are supported)
+
+        Returns:
+            Path to the sidecar file
+        """
+        sidecar_path = self.exports_dir / f"{filename}.anomalies.json"
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(
+                data,
+                default=_json_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            payload = json.dumps(data, default=_json_default).encode('utf-8')
+
+        sidecar_path.write_bytes(payload)
+        return sidecar_path
+
+    def _write_html(
+        self,
+        html_path: Path,
+        title: str,
+        data_summary: Dict,
+        quality_score: Optional[Dict],
+        anomalies: List,
+        visualizations: List,
+        anomaly_total: int = 0,
+        anomaly_sidecar: Optional[str] = None
+    ):
+        """Render the HTML report into html_path"""
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write(_HTML_HEAD_BEFORE_TITLE)
+            f.write(escape(title))
+            f.write(_HTML_HEAD_AFTER_TITLE)
+            _render_summary(
+                f,
+                title,
+                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                data_summary,
+                quality_score
+            )
+
+            if not (anomalies or visualizations):
+                # No list sections, skip the template and just close the page
+                f.write(_HTML_FOOT)
+                return
+
+            # Stream the list sections straight into the file rather than
+            # building them in memory first
+            stream = _html_sections_template().stream(
+                anomalies=anomalies,
+                anomaly_total=anomaly_total,
+                anomaly_sidecar=anomaly_sidecar,
+                visualizations=visualizations
+            )
+            stream.enable_buffering(size=64)
+            stream.dump(f)
+
+    def create_batch_download_zip(
+        self,
+        files: Dict[str, pd.DataFrame],
+        zip_name: str,
+        max_workers: Optional[int] = None,
+        archive_format: str = 'zip'
+    ) -> Path:
         """
         Create ZIP file with multiple cleaned datasets
 
+        Larger batches serialise their CSVs in parallel worker processes;
+        small batches stream each CSV straight into the archive. ZIPs whose
+        data exceeds ZIP_STORED_THRESHOLD_BYTES are stored uncompressed, use
+        archive_format='tzst' for fast multi-threaded compression of large exports.
+
         Args:
             files: Dictionary of filename -> DataFrame
             zip_name: Name for ZIP file
+            max_workers: Worker processes for CSV serialisation (default: CPU count)
+            archive_format: 'zip' or 'tzst' (zstandard-compressed tar)
 
         Returns:
-            Path to ZIP file
+            Path to ZIP file (or .tar.zst archive)
         """
-        import zipfile
-
-        zip_path = self.exports_dir / f"{zip_name}.zip"
+        if archive_format not in BATCH_ARCHIVE_FORMATS:
+            raise ValueError(
+                f"Unknown archive format '{archive_format}'. Choose from: {', '.join(BATCH_ARCHIVE_FORMATS)}"
+            )
+        if archive_format == 'tzst' and not ZSTANDARD_AVAILABLE:
+            raise ImportError("zstandard not installed. Install with: pip install zstandard")
+
+        workers = max_workers or os.cpu_count() or 1
+        if len(files) < PARALLEL_ZIP_MIN_FILES:
+            workers = 1
+
+        if archive_format == 'tzst':
+            zip_path = self.exports_dir / f"{zip_name}.tar.zst"
+        else:
+            zip_path = self.exports_dir / f"{zip_name}.zip"
 
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for filename, df in files.items():
-                    # Create CSV in memory
-                    csv_buffer = BytesIO()
-                    df.to_csv(csv_buffer, index=False)
-                    csv_buffer.seek(0)
-
-                    # Add to ZIP
-                    zipf.writestr(f"cleaned_{filename}", csv_buffer.getvalue())
+            if archive_format == 'tzst':
+                self._write_tzst(zip_path, files, workers)
+            else:
+                self._write_zip(zip_path, files, workers)
 
             logger.info(f"Batch ZIP created: {zip_path} ({len(files)} files)")
             return zip_path
@@ -541,6 +1077,71 @@ class ReportGenerator:
             logger.error(f"Failed to create batch ZIP: {e}")
             raise
 
+    async def create_batch_download_zip_async(
+        self,
+        files: Dict[str, pd.DataFrame],
+        zip_name: str,
+        max_workers: Optional[int] = None,
+        archive_format: str = 'zip'
+    ) -> Path:
+        """
+        Create a batch archive without blocking the event loop
+
+        Runs create_batch_download_zip in a worker thread; compression and
+        file writes release the GIL, so several archives gathered together
+        overlap their disk I/O.
+
+        Args:
+            files: Dictionary of filename -> DataFrame
+            zip_name: Name for ZIP file
+            max_workers: Worker processes for CSV serialisation (default: CPU count)
+            archive_format: 'zip' or 'tzst' (zstandard-compressed tar)
+
+        Returns:
+            Path to ZIP file (or .tar.zst archive)
+        """
+        return await asyncio.to_thread(
+            self.create_batch_download_zip, files, zip_name, max_workers, archive_format
+        )
+
+    def _write_zip(self, zip_path: Path, files: Dict[str, pd.DataFrame], workers: int):
+        """Write cleaned CSVs into a ZIP archive"""
+        # deep=True counts string payloads, not just 8-byte object pointers
+        est_bytes = sum(int(df.memory_usage(index=False, deep=True).sum()) for df in files.values())
+        if est_bytes < ZIP_STORED_THRESHOLD_BYTES:
+            compression = zipfile.ZIP_DEFLATED
+        else:
+            compression = zipfile.ZIP_STORED
+
+        with zipfile.ZipFile(zip_path, 'w', compression, compresslevel=1) as zipf:
+            if workers > 1:
+                for filename, csv_bytes in _iter_csv_bytes(files, workers):
+                    zipf.writestr(f"cleaned_{filename}", csv_bytes)
+            else:
+                for filename, df in files.items():
+                    # Write the CSV straight into the archive entry
+                    with zipf.open(f"cleaned_{filename}", 'w', force_zip64=True) as raw:
+                        _write_csv(df, raw)
+
+    def _write_tzst(self, archive_path: Path, files: Dict[str, pd.DataFrame], workers: int):
+        """Write cleaned CSVs into a zstandard-compressed tar archive"""
+        compressor = zstd.ZstdCompressor(level=3, threads=-1)
+        mtime = time.time()
+
+        with open(archive_path, 'wb') as fh, \
+                compressor.stream_writer(fh) as zst, \
+                tarfile.open(fileobj=zst, mode='w|') as tar:
+            for filename, csv_bytes in _iter_csv_bytes(files, workers):
+                info = tarfile.TarInfo(f"cleaned_{filename}")
+                info.size = len(csv_bytes)
+                info.mtime = mtime
+                tar.addfile(info, BytesIO(csv_bytes))
+
+
+def _generate_pdf_report_worker(exports_dir: Path, spec: Dict) -> Path:
+    """Generate one PDF report in a worker process"""
+    return ReportGenerator(exports_dir).generate_pdf_report(**spec)
+
 
 # Global report generator instance
 _report_generator = ReportGenerator()
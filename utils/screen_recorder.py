@@ -2,17 +2,16 @@
 Screen recording and live analysis for Tableau dashboards
 Captures screen activity and provides real-time feedback using Claude Vision
 """
-import cv2
 import numpy as np
-import tempfile
 import base64
+from functools import lru_cache, partial
+from io import BytesIO
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 from datetime import datetime
 import time
 from PIL import Image, ImageGrab
 import threading
-import queue
 
 try:
     from mss import mss
@@ -20,28 +19,102 @@ try:
 except ImportError:
     MSS_AVAILABLE = False
 
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _TJ = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+except (ImportError, OSError, RuntimeError):
+    # RuntimeError/OSError: PyTurboJPEG installed but libturbojpeg not found
+    TURBOJPEG_AVAILABLE = False
+
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Frames are compared as 64x64 block-averaged grayscale thumbnails; a frame
+# is unchanged when no block's mean brightness moved by more than this many
+# levels. Each block averages every pixel it covers, so a KPI or label
+# update changes its block even when it is a few pixels wide.
+FRAME_THUMBNAIL_SIZE = 64
+FRAME_DEDUP_MAX_DELTA = 2
+
+# Frames sent for analysis are downscaled to at most this width
+MAX_FRAME_WIDTH = 1280
+
+# Below this size the SIMD encoder's dispatch overhead outweighs its speedup
+SIMD_BASE64_MIN_BYTES = 256
+
+
+@lru_cache(maxsize=16)
+def _frame_target_size(width: int, height: int) -> Tuple[int, int]:
+    """Size a frame is sent at; computed once per capture size"""
+    if width <= MAX_FRAME_WIDTH:
+        return width, height
+    ratio = MAX_FRAME_WIDTH / width
+    return MAX_FRAME_WIDTH, int(height * ratio)
+
+
+def _reduce_for_analysis(img: Image.Image) -> Image.Image:
+    """
+    Box-downsample a frame by the largest integer factor that keeps it at
+    least MAX_FRAME_WIDTH wide
+
+    Integer reduction is much cheaper than a LANCZOS resize of the full
+    frame; any remaining scaling happens in get_frame_as_base64.
+    """
+    factor = img.width // MAX_FRAME_WIDTH
+    if factor < 2:
+        return img
+    return img.reduce(factor)
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64-encode bytes, using pybase64's SIMD encoder when available"""
+    if PYBASE64_AVAILABLE and len(data) > SIMD_BASE64_MIN_BYTES:
+        return pybase64.b64encode(data).decode('ascii')
+    return base64.b64encode(data).decode('ascii')
+
 
 class ScreenRecorder:
     """Record and analyze screen activity in real-time"""
 
-    def __init__(self, fps: int = 2, quality: int = 80):
+    def __init__(
+        self,
+        fps: int = 2,
+        quality: int = 80,
+        skip_unchanged_frames: bool = True,
+        encode_in_background: bool = True,
+        optimize_jpeg: bool = False
+    ):
         """
         Initialize screen recorder
 
         Args:
             fps: Frames per second to capture (lower = less API calls)
             quality: JPEG quality (1-100)
+            skip_unchanged_frames: Drop frames that look the same as the previous one
+            encode_in_background: Pre-encode new frames to base64 JPEG on a worker thread
+            optimize_jpeg: Run Pillow's extra Huffman-optimisation pass (slower, ~3-5% smaller)
         """
         self.fps = fps
         self.quality = quality
+        self.skip_unchanged_frames = skip_unchanged_frames
+        self.encode_in_background = encode_in_background
+        self.optimize_jpeg = optimize_jpeg
         self.is_recording = False
-        self.frame_queue = queue.Queue(maxsize=10)
+        self._latest_frame = None
+        self._frame_lock = threading.Lock()
+        self._frame_ready = threading.Event()
         self.analysis_callback = None
         self.capture_thread = None
+        self.encode_thread = None
+        self._last_thumbnail = None
 
         logger.info(f"Screen recorder initialized: fps={fps}, quality={quality}")
 
@@ -58,6 +131,7 @@ class ScreenRecorder:
             return
 
         self.is_recording = True
+        self._last_thumbnail = None
 
         if MSS_AVAILABLE:
             self.capture_thread = threading.Thread(
@@ -73,6 +147,11 @@ class ScreenRecorder:
             )
 
         self.capture_thread.start()
+
+        if self.encode_in_background:
+            self.encode_thread = threading.Thread(target=self._encode_loop, daemon=True)
+            self.encode_thread.start()
+
         logger.info("Screen recording started")
 
     def stop_recording(self):
@@ -80,6 +159,9 @@ class ScreenRecorder:
         self.is_recording = False
         if self.capture_thread:
             self.capture_thread.join(timeout=2)
+        if self.encode_thread:
+            self._frame_ready.set()
+            self.encode_thread.join(timeout=2)
         logger.info("Screen recording stopped")
 
     def _capture_loop_mss(self, monitor: int, region: Optional[tuple]):
@@ -96,91 +178,180 @@ class ScreenRecorder:
             else:
                 monitor_config = sct.monitors[monitor]
 
+            # One mss handle serves every frame of this recording; mss
+            # handles are bound to the thread that created them
+            grab = sct.grab
+            store_frame = self._store_frame
+            wait_for_next_frame = self._wait_for_next_frame
             frame_delay = 1.0 / self.fps
+            next_deadline = time.monotonic()
 
             while self.is_recording:
-                start_time = time.time()
-
                 try:
                     # Capture screen
-                    screenshot = sct.grab(monitor_config)
+                    screenshot = grab(monitor_config)
 
-                    # Convert to PIL Image
-                    img = Image.frombytes(
+                    # Convert to PIL Image straight from the grab buffer
+                    # (screenshot.bgra would first copy it into a bytes object)
+                    img = Image.frombuffer(
                         'RGB',
                         screenshot.size,
-                        screenshot.bgra,
+                        screenshot.raw,
                         'raw',
-                        'BGRX'
+                        'BGRX',
+                        0,
+                        1
                     )
 
-                    # Add to queue (non-blocking)
-                    try:
-                        self.frame_queue.put_nowait({
-                            'timestamp': datetime.now(),
-                            'image': img
-                        })
-                    except queue.Full:
-                        # Skip frame if queue is full
-                        logger.debug("Frame queue full, skipping frame")
+                    store_frame(img)
 
                 except Exception as e:
                     logger.error(f"Error capturing frame: {e}")
 
                 # Maintain FPS
-                elapsed = time.time() - start_time
-                sleep_time = max(0, frame_delay - elapsed)
-                time.sleep(sleep_time)
+                next_deadline = wait_for_next_frame(next_deadline, frame_delay)
 
     def _capture_loop_pil(self, region: Optional[tuple]):
         """Capture loop using PIL (fallback)"""
+        # Resolve the grab call and bound methods once so the loop body
+        # only touches locals
+        if region:
+            bbox = (region[0], region[1],
+                    region[0] + region[2],
+                    region[1] + region[3])
+        else:
+            bbox = None
+        grab = partial(ImageGrab.grab, bbox=bbox)
+        store_frame = self._store_frame
+        wait_for_next_frame = self._wait_for_next_frame
         frame_delay = 1.0 / self.fps
+        next_deadline = time.monotonic()
 
         while self.is_recording:
-            start_time = time.time()
-
             try:
                 # Capture screen
-                if region:
-                    bbox = (region[0], region[1],
-                           region[0] + region[2],
-                           region[1] + region[3])
-                    img = ImageGrab.grab(bbox=bbox)
-                else:
-                    img = ImageGrab.grab()
-
-                # Add to queue (non-blocking)
-                try:
-                    self.frame_queue.put_nowait({
-                        'timestamp': datetime.now(),
-                        'image': img
-                    })
-                except queue.Full:
-                    logger.debug("Frame queue full, skipping frame")
+                store_frame(grab())
 
             except Exception as e:
                 logger.error(f"Error capturing frame: {e}")
 
             # Maintain FPS
-            elapsed = time.time() - start_time
-            sleep_time = max(0, frame_delay - elapsed)
-            time.sleep(sleep_time)
+            next_deadline = wait_for_next_frame(next_deadline, frame_delay)
+
+    @staticmethod
+    def _wait_for_next_frame(deadline: float, frame_delay: float) -> float:
+        """
+        Sleep until the next frame is due
+
+        Deadlines advance by a fixed step on the monotonic clock, so frame
+        timing does not drift with capture time or wall-clock adjustments.
+
+        Args:
+            deadline: Deadline of the frame just captured
+            frame_delay: Seconds between frames
+
+        Returns:
+            Deadline of the frame about to be captured
+        """
+        deadline += frame_delay
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+            return deadline
+
+        # Capture overran the frame interval: restart the schedule from now
+        # instead of firing a burst of catch-up frames
+        return time.monotonic()
+
+    def _store_frame(self, img: Image.Image):
+        """
+        Store a captured frame unless it is unchanged from the previous one
+
+        An unchanged frame is not stored, but the frame it matches stays in
+        the slot (with its pre-encoded base64), so a static screen can
+        still be analyzed at any time.
+
+        Args:
+            img: Captured frame
+        """
+        if self.skip_unchanged_frames:
+            thumbnail = self._frame_thumbnail(img)
+            last_thumbnail = self._last_thumbnail
+            if last_thumbnail is not None and self._thumbnails_match(thumbnail, last_thumbnail):
+                return
+            self._last_thumbnail = thumbnail
+
+        # Shrink large captures before storing so encoding, upload and
+        # the held frame all work on the smaller image
+        img = _reduce_for_analysis(img)
+
+        # Only the newest frame is kept; an unread older frame is replaced
+        frame = {
+            'timestamp': datetime.now(),
+            'image': img
+        }
+        with self._frame_lock:
+            self._latest_frame = frame
+        self._frame_ready.set()
+
+    def _encode_loop(self):
+        """
+        Pre-encode the newest frame while the capture thread keeps grabbing
+
+        The base64 JPEG is stored on the frame dict under 'base64', so an
+        analysis request finds it ready instead of encoding on its own thread.
+        """
+        while self.is_recording:
+            if not self._frame_ready.wait(timeout=1.0):
+                continue
+            self._frame_ready.clear()
+
+            with self._frame_lock:
+                frame = self._latest_frame
+            if frame is None or 'base64' in frame:
+                continue
+
+            try:
+                frame['base64'] = self.get_frame_as_base64(frame)
+            except Exception as e:
+                logger.error(f"Error encoding frame: {e}")
+
+    @staticmethod
+    def _frame_thumbnail(img: Image.Image) -> np.ndarray:
+        """
+        Block-average a frame down to a small grayscale thumbnail
+
+        Args:
+            img: Captured frame
+
+        Returns:
+            FRAME_THUMBNAIL_SIZE square uint8 array of block mean brightness
+        """
+        size = (FRAME_THUMBNAIL_SIZE, FRAME_THUMBNAIL_SIZE)
+        small = img.convert('L').resize(size, Image.Resampling.BOX)
+        return np.asarray(small, dtype=np.uint8)
+
+    @staticmethod
+    def _thumbnails_match(thumbnail: np.ndarray, other: np.ndarray) -> bool:
+        """Check whether no block differs by more than FRAME_DEDUP_MAX_DELTA"""
+        if thumbnail.shape != other.shape:
+            return False
+        delta = np.abs(thumbnail.astype(np.int16) - other.astype(np.int16))
+        return int(delta.max()) <= FRAME_DEDUP_MAX_DELTA
 
     def get_latest_frame(self) -> Optional[Dict]:
         """
         Get latest captured frame
 
+        The frame is not consumed: it stays readable until a changed frame
+        replaces it, so repeated analyses of a static screen all succeed.
+
         Returns:
-            Dictionary with timestamp and image, or None
+            Dictionary with timestamp and image (and 'base64' once
+            pre-encoded), or None before the first capture
         """
-        try:
-            # Clear queue and get latest
-            latest_frame = None
-            while not self.frame_queue.empty():
-                latest_frame = self.frame_queue.get_nowait()
-            return latest_frame
-        except queue.Empty:
-            return None
+        with self._frame_lock:
+            return self._latest_frame
 
     def get_frame_as_base64(self, frame_data: Dict) -> str:
         """
@@ -194,22 +365,34 @@ class ScreenRecorder:
         """
         img = frame_data['image']
 
-        # Resize if too large (max 1280px width)
-        max_width = 1280
-        if img.width > max_width:
-            ratio = max_width / img.width
-            new_size = (max_width, int(img.height * ratio))
-            img = img.resize(new_size, Image.Resampling.LANCZOS)
-
-        # Convert to JPEG bytes
-        from io import BytesIO
-        buffer = BytesIO()
-        img.save(buffer, format='JPEG', quality=self.quality, optimize=True)
-        buffer.seek(0)
+        # Resize if too large (max MAX_FRAME_WIDTH px width)
+        target_size = _frame_target_size(img.width, img.height)
+        if target_size != img.size:
+            img = img.resize(target_size, Image.Resampling.LANCZOS)
 
         # Encode to base64
-        img_base64 = base64.b64encode(buffer.getvalue()).decode()
-        return img_base64
+        return _b64encode(self._encode_jpeg(img))
+
+    def _encode_jpeg(self, img: Image.Image) -> bytes:
+        """
+        Encode an image as JPEG
+
+        Uses libjpeg-turbo directly on the pixel array when PyTurboJPEG is
+        available, otherwise Pillow's encoder.
+
+        Args:
+            img: PIL image
+
+        Returns:
+            JPEG bytes
+        """
+        if TURBOJPEG_AVAILABLE:
+            pixels = np.asarray(img if img.mode == 'RGB' else img.convert('RGB'))
+            return _TJ.encode(pixels, quality=self.quality, pixel_format=TJPF_RGB)
+
+        buffer = BytesIO()
+        img.save(buffer, format='JPEG', quality=self.quality, optimize=self.optimize_jpeg)
+        return buffer.getvalue()
 
     def save_frame(self, frame_data: Dict, filepath: Path):
         """
@@ -219,8 +402,7 @@ class ScreenRecorder:
             frame_data: Frame dictionary
             filepath: Path to save image
         """
-        img = frame_data['image']
-        img.save(filepath, format='JPEG', quality=self.quality, optimize=True)
+        Path(filepath).write_bytes(self._encode_jpeg(frame_data['image']))
         logger.debug(f"Frame saved: {filepath}")
 
 
@@ -288,8 +470,8 @@ class LiveAnalysisSession:
             }
 
         try:
-            # Convert to base64
-            img_base64 = self.recorder.get_frame_as_base64(frame_data)
+            # Use the background-encoded frame if it is ready
+            img_base64 = frame_data.get('base64') or self.recorder.get_frame_as_base64(frame_data)
 
             # Analyze with Claude
             prompt = custom_prompt or self.default_prompt
@@ -4,11 +4,18 @@ Provides AI-powered UX/accessibility analysis of dashboard screenshots
 """
 
 from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
+import asyncio
 import base64
+import hashlib
 import os
+import re
+import time
 
 try:
     from PIL import Image
@@ -17,6 +24,12 @@ except ImportError:
     PIL_AVAILABLE = False
     Image = None
 
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
 from config.settings import (
     SCREENSHOT_MAX_SIZE_MB,
     SCREENSHOT_MIN_DIMENSION,
@@ -26,6 +39,107 @@ from config.settings import (
     API_TIMEOUT
 )
 
+# Message Batches API limits and polling schedule. Inputs beyond either
+# limit are split across several batches; the byte budget leaves headroom
+# below the 256 MB request cap for JSON framing.
+MAX_BATCH_REQUESTS = 100_000
+MAX_BATCH_BYTES = 200 << 20
+BATCH_REQUEST_OVERHEAD_BYTES = 4096
+BATCH_POLL_INITIAL_SECONDS = 5.0
+BATCH_POLL_MAX_SECONDS = 60.0
+
+# Concurrent single-shot requests in analyze_many, and SDK retries (with
+# exponential backoff) on rate limits, timeouts and server errors
+MAX_CONCURRENT_ANALYSES = 10
+API_MAX_RETRIES = 4
+
+# Longest edge the vision model uses; larger screenshots are downscaled
+# before upload since the extra pixels only add tokens and payload
+VISION_MAX_EDGE_PX = 1568
+
+# Beta flag for referencing uploaded images by file_id
+FILES_API_BETA = "files-api-2025-04-14"
+
+# One line of an AI response: a section header, a list item, or a
+# "key: value" entry, tokenized in a single pass over the whole text
+_RESPONSE_LINE_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<header>OVERALL_SCORE|ASPECT_SCORES|STRENGTHS|WEAKNESSES|RECOMMENDATIONS|'
+    r'ACCESSIBILITY_ISSUES|DETAILED_FEEDBACK):(?P<value>.*)'
+    r'|-(?P<item>.*)'
+    r'|(?P<key>[^:\n]*):(?P<text>.*)'
+    r')$',
+    re.MULTILINE
+)
+
+
+# Tool the model is required to call, so analyses arrive as structured input
+# instead of free-form text
+ANALYSIS_TOOL_NAME = "emit_analysis"
+_STRING_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+ANALYSIS_TOOL = {
+    "name": ANALYSIS_TOOL_NAME,
+    "description": "Report the UX and accessibility analysis of a dashboard screenshot",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "overall_score": {"type": "number", "minimum": 0, "maximum": 100},
+            "aspect_scores": {
+                "type": "object",
+                "additionalProperties": {"type": "number", "minimum": 0, "maximum": 100}
+            },
+            "strengths": _STRING_LIST_SCHEMA,
+            "weaknesses": _STRING_LIST_SCHEMA,
+            "recommendations": _STRING_LIST_SCHEMA,
+            "accessibility_issues": _STRING_LIST_SCHEMA,
+            "detailed_feedback": {
+                "type": "object",
+                "additionalProperties": {"type": "string"}
+            }
+        },
+        "required": [
+            "overall_score", "aspect_scores", "strengths", "weaknesses",
+            "recommendations", "accessibility_issues", "detailed_feedback"
+        ]
+    }
+}
+
+# Media types accepted by the vision API, by file extension
+IMAGE_MEDIA_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
+
+@lru_cache(maxsize=32)
+def _render_analysis_prompt(aspects: Tuple[str, ...]) -> str:
+    """Render the analysis prompt once per distinct aspect list"""
+    aspects_str = "\n".join([f"- {aspect.replace('_', ' ').title()}" for aspect in aspects])
+    aspect_keys = ", ".join(aspects)
+
+    prompt = f"""You are a Tableau dashboard UX expert. Analyze this dashboard screenshot for the following aspects:
+
+{aspects_str}
+
+For each aspect, provide:
+1. A score from 0-100
+2. Specific observations
+3. Actionable recommendations
+
+Also identify:
+- Overall strengths of the dashboard
+- Areas for improvement
+- Accessibility issues (color contrast, font sizes, etc.)
+- Best practices being followed or violated
+
+Report your analysis by calling the {ANALYSIS_TOOL_NAME} tool. Use these exact keys
+for aspect_scores and detailed_feedback: {aspect_keys}
+"""
+    return prompt
+
 
 @dataclass
 class ScreenshotAnalysis:
@@ -61,24 +175,35 @@ class DashboardScreenshotAnalyzer:
     Uses Claude AI vision capabilities when available
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_files_api: bool = False):
         """
         Initialize screenshot analyzer
 
         Args:
             api_key: Anthropic API key (if None, will use environment variable)
+            use_files_api: Upload screenshots through the Files API and send
+                them by file_id instead of inline base64. Each distinct
+                screenshot is uploaded once per analyzer, so re-analyzing it
+                sends no image data at all.
         """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        self.use_files_api = use_files_api
+        self._file_ids: Dict[str, str] = {}
 
         # Check if Anthropic client is available
         try:
             import anthropic
             self.anthropic = anthropic
             self.client = anthropic.Anthropic(api_key=self.api_key) if self.api_key else None
+            self.async_client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                max_retries=API_MAX_RETRIES
+            ) if self.api_key else None
             self.ai_available = self.client is not None
         except ImportError:
             self.anthropic = None
             self.client = None
+            self.async_client = None
             self.ai_available = False
 
     def analyze_screenshot(
@@ -103,33 +228,60 @@ class DashboardScreenshotAnalyzer:
         if not image_path.exists():
             raise FileNotFoundError(f"Screenshot not found: {image_path}")
 
-        # Get image metadata
-        analysis.image_metadata = self._get_image_metadata(image_path)
-
-        # Validate image size and dimensions
-        self._validate_image(image_path, analysis.image_metadata)
-
         # If AI is available, perform AI analysis
         if self.ai_available:
-            analysis = self._ai_analysis(image_path, custom_aspects or SCREENSHOT_ANALYSIS_ASPECTS)
+            # Validate and read the screenshot through a single file handle
+            analysis.image_metadata, image_bytes = self._load_image(image_path)
+            analysis = self._ai_analysis(
+                image_path,
+                custom_aspects or SCREENSHOT_ANALYSIS_ASPECTS,
+                image_bytes
+            )
         else:
+            # Get image metadata
+            analysis.image_metadata = self._get_image_metadata(image_path)
+
+            # Validate image size and dimensions
+            self._validate_image(image_path, analysis.image_metadata)
+
             # Fallback to basic analysis
             analysis = self._basic_analysis(image_path, analysis)
 
         return analysis
 
-    def _get_image_metadata(self, image_path: Path) -> Dict[str, Any]:
-        """Extract image metadata"""
+    def _load_image(self, image_path: Path) -> Tuple[Dict[str, Any], bytes]:
+        """
+        Validate a screenshot and read its bytes through one file handle
+
+        Args:
+            image_path: Path to screenshot
+
+        Returns:
+            Tuple of (image metadata, file bytes)
+        """
+        with open(image_path, 'rb') as image_file:
+            metadata = self._get_image_metadata(image_path, image_file)
+            self._validate_image(image_path, metadata)
+            image_file.seek(0)
+            return metadata, image_file.read()
+
+    def _get_image_metadata(self, image_path: Path, image_file=None) -> Dict[str, Any]:
+        """Extract image metadata, from an already open file when given"""
+        if image_file is not None:
+            file_size = os.fstat(image_file.fileno()).st_size
+        else:
+            file_size = image_path.stat().st_size
         metadata = {
             'filename': image_path.name,
-            'file_size_bytes': image_path.stat().st_size,
-            'file_size_mb': round(image_path.stat().st_size / (1024 * 1024), 2)
+            'file_size_bytes': file_size,
+            'file_size_mb': round(file_size / (1024 * 1024), 2)
         }
 
-        # Get image dimensions if PIL available
+        # Get image dimensions if PIL available. Image.open only parses the
+        # header; nothing here may touch pixel data (load(), getdata(), ...)
         if PIL_AVAILABLE:
             try:
-                with Image.open(image_path) as img:
+                with Image.open(image_file or image_path) as img:
                     metadata['width'] = img.width
                     metadata['height'] = img.height
                     metadata['format'] = img.format
@@ -160,7 +312,8 @@ class DashboardScreenshotAnalyzer:
     def _ai_analysis(
         self,
         image_path: Path,
-        aspects: List[str]
+        aspects: List[str],
+        image_bytes: Optional[bytes] = None
     ) -> ScreenshotAnalysis:
         """
         Perform AI-powered analysis using Claude
@@ -168,58 +321,32 @@ class DashboardScreenshotAnalyzer:
         Args:
             image_path: Path to screenshot
             aspects: Analysis aspects to evaluate
+            image_bytes: Screenshot file contents, if already read
 
         Returns:
             ScreenshotAnalysis with AI feedback
         """
         analysis = ScreenshotAnalysis()
 
-        # Encode image to base64
-        image_data = self._encode_image(image_path)
-
-        # Determine media type
-        extension = image_path.suffix.lower()
-        media_type_map = {
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp'
-        }
-        media_type = media_type_map.get(extension, 'image/png')
-
-        # Build analysis prompt
-        prompt = self._build_analysis_prompt(aspects)
+        if self.use_files_api:
+            if image_bytes is None:
+                image_bytes = image_path.read_bytes()
+        else:
+            params = self._build_request_params(image_path, aspects, image_bytes)
 
         try:
             # Call Claude API with vision
-            response = self.client.messages.create(
-                model=ANTHROPIC_MODEL,
-                max_tokens=MAX_TOKENS,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_data,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ],
-                    }
-                ],
-            )
+            if self.use_files_api:
+                image_source = self._upload_image(image_path, image_bytes)
+                response = self.client.beta.messages.create(
+                    **self._build_request_params(image_path, aspects, image_source=image_source),
+                    betas=[FILES_API_BETA]
+                )
+            else:
+                response = self.client.messages.create(**params)
 
             # Parse response
-            response_text = response.content[0].text
-            analysis = self._parse_ai_response(response_text, aspects)
+            analysis = self._parse_ai_message(response.content, aspects)
 
         except Exception as e:
             # Fallback to basic analysis on error
@@ -230,139 +357,506 @@ class DashboardScreenshotAnalyzer:
 
         return analysis
 
-    def _encode_image(self, image_path: Path) -> str:
-        """Encode image to base64"""
-        with open(image_path, 'rb') as image_file:
-            return base64.standard_b64encode(image_file.read()).decode('utf-8')
+    def analyze_screenshots_batch(
+        self,
+        image_paths: List[str],
+        custom_aspects: Optional[List[str]] = None
+    ) -> Dict[str, ScreenshotAnalysis]:
+        """
+        Analyze many screenshots as Message Batches jobs
+
+        Batched requests are billed at half price, but results can take
+        anywhere from minutes up to 24 hours; use analyze_screenshot when an
+        answer is needed right away. Inputs larger than one batch allows
+        (MAX_BATCH_REQUESTS requests or MAX_BATCH_BYTES of encoded images)
+        are submitted as several batches.
+
+        Args:
+            image_paths: Paths to screenshot images
+            custom_aspects: Optional custom analysis aspects
+
+        Returns:
+            Dictionary mapping each input path to its ScreenshotAnalysis
+        """
+        if not image_paths:
+            return {}
+
+        if not self.ai_available:
+            # Basic analysis only reads image headers, so overlap the file
+            # I/O across a thread pool
+            with ThreadPoolExecutor(max_workers=min(32, len(image_paths) or 1)) as executor:
+                return dict(zip(image_paths, executor.map(self.analyze_screenshot, image_paths)))
+
+        aspects = custom_aspects or SCREENSHOT_ANALYSIS_ASPECTS
+
+        # Validate every image up front, as analyze_screenshot does
+        paths = {}
+        metadata = {}
+        image_bytes = {}
+        for image_path in image_paths:
+            path = Path(image_path)
+            if not path.exists():
+                raise FileNotFoundError(f"Screenshot not found: {path}")
+            metadata[image_path], image_bytes[image_path] = self._load_image(path)
+            paths[image_path] = path
+
+        results = self._run_batch(paths, aspects, image_bytes)
+
+        for image_path, analysis in results.items():
+            analysis.image_metadata = metadata[image_path]
+
+        return results
+
+    def _run_batch(
+        self,
+        paths: Dict[str, Path],
+        aspects: List[str],
+        image_bytes: Dict[str, bytes]
+    ) -> Dict[str, ScreenshotAnalysis]:
+        """
+        Submit Message Batches jobs, wait for them to end and parse results
+
+        Args:
+            paths: Mapping of input path strings to resolved paths
+            aspects: Analysis aspects to evaluate
+            image_bytes: Mapping of input path strings to file contents;
+                entries are released once encoded
+
+        Returns:
+            Dictionary mapping each input path to its ScreenshotAnalysis
+        """
+        if not paths:
+            return {}
+
+        # custom_id must be short and alphanumeric, so index the inputs
+        # rather than embedding the paths themselves
+        custom_ids = {f"screenshot-{i}": image_path for i, image_path in enumerate(paths)}
+
+        batches = [
+            self.client.messages.batches.create(requests=requests)
+            for requests in self._iter_batch_requests(custom_ids, paths, aspects, image_bytes)
+        ]
+
+        # Poll with exponential backoff until every batch has ended
+        delay = BATCH_POLL_INITIAL_SECONDS
+        pending = [batch.id for batch in batches if batch.processing_status != "ended"]
+        while pending:
+            time.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+            pending = [
+                batch_id for batch_id in pending
+                if self.client.messages.batches.retrieve(batch_id).processing_status != "ended"
+            ]
+
+        results = {}
+        for batch in batches:
+            for entry in self.client.messages.batches.results(batch.id):
+                image_path = custom_ids.get(entry.custom_id)
+                if image_path is None:
+                    continue
+
+                if entry.result.type == "succeeded":
+                    results[image_path] = self._parse_ai_message(
+                        entry.result.message.content, aspects
+                    )
+                else:
+                    analysis = ScreenshotAnalysis()
+                    analysis.recommendations.append(
+                        f"AI analysis failed: batch request {entry.result.type}. "
+                        "Using basic analysis."
+                    )
+                    results[image_path] = self._basic_analysis(paths[image_path], analysis)
+
+        # Requests missing from the results are treated as failed
+        for image_path, path in paths.items():
+            if image_path not in results:
+                analysis = ScreenshotAnalysis()
+                analysis.recommendations.append(
+                    "AI analysis failed: no batch result returned. Using basic analysis."
+                )
+                results[image_path] = self._basic_analysis(path, analysis)
+
+        return results
+
+    def _iter_batch_requests(
+        self,
+        custom_ids: Dict[str, str],
+        paths: Dict[str, Path],
+        aspects: List[str],
+        image_bytes: Dict[str, bytes]
+    ):
+        """
+        Encode batch requests and group them into batches within the API limits
+
+        Only one batch worth of encoded requests is held at a time.
+
+        Args:
+            custom_ids: Mapping of custom_id to input path string
+            paths: Mapping of input path strings to resolved paths
+            aspects: Analysis aspects to evaluate
+            image_bytes: Mapping of input path strings to file contents;
+                entries are released once encoded
+
+        Yields:
+            Lists of batch requests, each within MAX_BATCH_REQUESTS requests
+            and MAX_BATCH_BYTES of estimated payload
+        """
+        prompt_bytes = len(self._build_analysis_prompt(aspects).encode('utf-8'))
+        requests = []
+        batch_bytes = 0
+
+        for custom_id, image_path in custom_ids.items():
+            params = self._build_request_params(
+                paths[image_path], aspects, image_bytes.pop(image_path)
+            )
+            request_bytes = (
+                len(params["messages"][0]["content"][0]["source"]["data"])
+                + prompt_bytes
+                + BATCH_REQUEST_OVERHEAD_BYTES
+            )
+
+            if requests and (
+                len(requests) >= MAX_BATCH_REQUESTS
+                or batch_bytes + request_bytes > MAX_BATCH_BYTES
+            ):
+                yield requests
+                requests = []
+                batch_bytes = 0
+
+            requests.append({"custom_id": custom_id, "params": params})
+            batch_bytes += request_bytes
+
+        if requests:
+            yield requests
+
+    async def analyze_many(
+        self,
+        image_paths: List[str],
+        custom_aspects: Optional[List[str]] = None,
+        max_concurrency: int = MAX_CONCURRENT_ANALYSES
+    ) -> Dict[str, Any]:
+        """
+        Analyze many screenshots with concurrent single-shot requests
+
+        Use this instead of analyze_screenshots_batch when results are
+        needed right away. At most max_concurrency requests are in flight.
+
+        Args:
+            image_paths: Paths to screenshot images
+            custom_aspects: Optional custom analysis aspects
+            max_concurrency: Maximum number of concurrent API requests
+
+        Returns:
+            Dictionary mapping each input path to its ScreenshotAnalysis, or
+            to the exception raised for it (e.g. FileNotFoundError)
+        """
+        aspects = custom_aspects or SCREENSHOT_ANALYSIS_ASPECTS
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        results = await asyncio.gather(
+            *(self._analyze_screenshot_async(image_path, aspects, semaphore)
+              for image_path in image_paths),
+            return_exceptions=True
+        )
+        return dict(zip(image_paths, results))
+
+    async def _analyze_screenshot_async(
+        self,
+        image_path: str,
+        aspects: List[str],
+        semaphore: asyncio.Semaphore
+    ) -> ScreenshotAnalysis:
+        """
+        Async counterpart of analyze_screenshot
+
+        Args:
+            image_path: Path to screenshot image
+            aspects: Analysis aspects to evaluate
+            semaphore: Semaphore bounding concurrent API requests
+
+        Returns:
+            ScreenshotAnalysis with results
+        """
+        # Validate image
+        image_path = Path(image_path)
+        if not image_path.exists():
+            raise FileNotFoundError(f"Screenshot not found: {image_path}")
+
+        if self.async_client is None:
+            metadata = await asyncio.to_thread(self._get_image_metadata, image_path)
+            self._validate_image(image_path, metadata)
+            return await asyncio.to_thread(
+                self._basic_analysis, image_path, ScreenshotAnalysis(image_metadata=metadata)
+            )
+
+        return await self._ai_analysis_async(image_path, aspects, semaphore)
+
+    async def _ai_analysis_async(
+        self,
+        image_path: Path,
+        aspects: List[str],
+        semaphore: asyncio.Semaphore
+    ) -> ScreenshotAnalysis:
+        """
+        Async counterpart of _ai_analysis
+
+        The screenshot is read, validated and encoded only once a semaphore
+        slot is free, so at most max_concurrency encoded payloads are held
+        in memory however many screenshots are queued.
+
+        Args:
+            image_path: Path to screenshot
+            aspects: Analysis aspects to evaluate
+            semaphore: Semaphore bounding concurrent API requests
+
+        Returns:
+            ScreenshotAnalysis with AI feedback
+        """
+        analysis = ScreenshotAnalysis()
+
+        async with semaphore:
+            _, image_bytes = await asyncio.to_thread(self._load_image, image_path)
+            params = await asyncio.to_thread(
+                self._build_request_params, image_path, aspects, image_bytes
+            )
+            del image_bytes
+
+            try:
+                response = await self.async_client.messages.create(**params)
+
+                # Parse response
+                analysis = self._parse_ai_message(response.content, aspects)
+
+            except Exception as e:
+                # Fallback to basic analysis on error
+                analysis.recommendations.append(
+                    f"AI analysis failed: {str(e)}. Using basic analysis."
+                )
+                analysis = await asyncio.to_thread(self._basic_analysis, image_path, analysis)
+
+        return analysis
+
+    def _prepare_image(
+        self,
+        image_path: Path,
+        image_bytes: Optional[bytes] = None
+    ) -> Tuple[bytes, str]:
+        """
+        Downscale a screenshot to the model's working resolution if larger
+
+        Args:
+            image_path: Path to screenshot
+            image_bytes: Screenshot file contents, if already read
+
+        Returns:
+            Tuple of (image bytes to send, media type)
+        """
+        if image_bytes is None:
+            image_bytes = image_path.read_bytes()
+        media_type = IMAGE_MEDIA_TYPES.get(image_path.suffix.lower(), 'image/png')
+
+        if not PIL_AVAILABLE:
+            return image_bytes, media_type
+
+        try:
+            with Image.open(BytesIO(image_bytes)) as img:
+                # Only the header has been read so far; small images go as-is
+                if max(img.size) <= VISION_MAX_EDGE_PX:
+                    return image_bytes, media_type
+
+                img.thumbnail((VISION_MAX_EDGE_PX, VISION_MAX_EDGE_PX), Image.LANCZOS)
+
+                buffer = BytesIO()
+                if img.format == 'JPEG':
+                    img.save(buffer, format='JPEG', quality=90)
+                    media_type = 'image/jpeg'
+                else:
+                    img.save(buffer, format='PNG')
+                    media_type = 'image/png'
+                return buffer.getvalue(), media_type
+        except Exception:
+            # Send the original if it cannot be decoded here
+            return image_bytes, media_type
+
+    def _upload_image(self, image_path: Path, image_bytes: bytes) -> Dict[str, str]:
+        """
+        Upload a screenshot through the Files API, once per distinct content
+
+        Args:
+            image_path: Path to screenshot
+            image_bytes: Screenshot file contents
+
+        Returns:
+            Image source block referencing the uploaded file
+        """
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        file_id = self._file_ids.get(digest)
+
+        if file_id is None:
+            data, media_type = self._prepare_image(image_path, image_bytes)
+            uploaded = self.client.beta.files.upload(
+                file=(image_path.name, data, media_type),
+                betas=[FILES_API_BETA]
+            )
+            file_id = self._file_ids[digest] = uploaded.id
+
+        return {"type": "file", "file_id": file_id}
+
+    def _build_request_params(
+        self,
+        image_path: Path,
+        aspects: List[str],
+        image_bytes: Optional[bytes] = None,
+        image_source: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the Messages API parameters for one screenshot
+
+        Args:
+            image_path: Path to screenshot
+            aspects: Analysis aspects to evaluate
+            image_bytes: Screenshot file contents, if already read
+            image_source: Image source block to send instead of inline base64
+
+        Returns:
+            Keyword arguments for messages.create or a batch request
+        """
+        if image_source is None:
+            # Encode image to base64
+            data, media_type = self._prepare_image(image_path, image_bytes)
+            image_source = {
+                "type": "base64",
+                "media_type": media_type,
+                "data": self._encode_image(image_path, data),
+            }
+
+        # Build analysis prompt
+        prompt = self._build_analysis_prompt(aspects)
+
+        return {
+            "model": ANTHROPIC_MODEL,
+            "max_tokens": MAX_TOKENS,
+            "tools": [ANALYSIS_TOOL],
+            "tool_choice": {"type": "tool", "name": ANALYSIS_TOOL_NAME},
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "image",
+                            "source": image_source,
+                        },
+                        {
+                            "type": "text",
+                            "text": prompt
+                        }
+                    ],
+                }
+            ],
+        }
+
+    def _encode_image(self, image_path: Path, data: Optional[bytes] = None) -> str:
+        """Encode image to base64, using pybase64's SIMD encoder when available"""
+        if data is None:
+            with open(image_path, 'rb') as image_file:
+                data = image_file.read()
+        if PYBASE64_AVAILABLE:
+            return pybase64.b64encode(data).decode('ascii')
+        return base64.standard_b64encode(data).decode('ascii')
 
     def _build_analysis_prompt(self, aspects: List[str]) -> str:
         """Build prompt for AI analysis"""
-        aspects_str = "\n".join([f"- {aspect.replace('_', ' ').title()}" for aspect in aspects])
+        return _render_analysis_prompt(tuple(aspects))
 
-        prompt = f"""You are a Tableau dashboard UX expert. Analyze this dashboard screenshot for the following aspects:
+    def _parse_ai_message(self, content: List[Any], aspects: List[str]) -> ScreenshotAnalysis:
+        """
+        Parse the content blocks of an AI response into ScreenshotAnalysis
 
-{aspects_str}
+        Args:
+            content: Content blocks of the response message
+            aspects: Analysis aspects that were evaluated
 
-For each aspect, provide:
-1. A score from 0-100
-2. Specific observations
-3. Actionable recommendations
+        Returns:
+            ScreenshotAnalysis from the analysis tool call, or from the text
+            response if the model answered without calling the tool
+        """
+        for block in content:
+            if block.type == "tool_use" and block.name == ANALYSIS_TOOL_NAME:
+                return self._analysis_from_tool_input(block.input)
 
-Also identify:
-- Overall strengths of the dashboard
-- Areas for improvement
-- Accessibility issues (color contrast, font sizes, etc.)
-- Best practices being followed or violated
+        response_text = "\n".join(block.text for block in content if block.type == "text")
+        return self._parse_ai_response(response_text, aspects)
 
-Format your response as follows:
-
-OVERALL_SCORE: [0-100]
-
-ASPECT_SCORES:
-layout_clarity: [0-100]
-label_readability: [0-100]
-filter_placement: [0-100]
-visual_clutter: [0-100]
-accessibility: [0-100]
-color_usage: [0-100]
-
-STRENGTHS:
-- [Strength 1]
-- [Strength 2]
-...
-
-WEAKNESSES:
-- [Weakness 1]
-- [Weakness 2]
-...
-
-RECOMMENDATIONS:
-- [Recommendation 1]
-- [Recommendation 2]
-...
-
-ACCESSIBILITY_ISSUES:
-- [Issue 1]
-- [Issue 2]
-...
-
-DETAILED_FEEDBACK:
-layout_clarity: [Detailed feedback about layout]
-label_readability: [Detailed feedback about labels]
-...
-"""
-        return prompt
+    def _analysis_from_tool_input(self, data: Dict[str, Any]) -> ScreenshotAnalysis:
+        """Build ScreenshotAnalysis from the analysis tool's input"""
+        analysis = ScreenshotAnalysis()
+
+        try:
+            analysis.overall_score = float(data.get('overall_score', 0.0))
+        except (TypeError, ValueError):
+            pass
+
+        for aspect, score in (data.get('aspect_scores') or {}).items():
+            try:
+                analysis.aspect_scores[aspect] = float(score)
+            except (TypeError, ValueError):
+                pass
+
+        analysis.strengths = [str(item) for item in data.get('strengths') or []]
+        analysis.weaknesses = [str(item) for item in data.get('weaknesses') or []]
+        analysis.recommendations = [str(item) for item in data.get('recommendations') or []]
+        analysis.accessibility_issues = [
+            str(item) for item in data.get('accessibility_issues') or []
+        ]
+        analysis.detailed_feedback = {
+            aspect: str(feedback)
+            for aspect, feedback in (data.get('detailed_feedback') or {}).items()
+        }
+
+        return analysis
 
     def _parse_ai_response(self, response_text: str, aspects: List[str]) -> ScreenshotAnalysis:
         """Parse AI response into ScreenshotAnalysis"""
         analysis = ScreenshotAnalysis()
 
-        lines = response_text.split('\n')
+        list_sections = {
+            'STRENGTHS': analysis.strengths,
+            'WEAKNESSES': analysis.weaknesses,
+            'RECOMMENDATIONS': analysis.recommendations,
+            'ACCESSIBILITY_ISSUES': analysis.accessibility_issues
+        }
         current_section = None
+        current_list = None
 
-        for line in lines:
-            line = line.strip()
-
-            if not line:
-                continue
+        for match in _RESPONSE_LINE_RE.finditer(response_text):
+            header, value, item, key, text = match.groups()
 
             # Parse sections
-            if line.startswith('OVERALL_SCORE:'):
+            if header == 'OVERALL_SCORE':
                 try:
-                    score = float(line.split(':')[1].strip())
-                    analysis.overall_score = score
-                except:
+                    analysis.overall_score = float(value.split(':', 1)[0])
+                except ValueError:
                     pass
 
-            elif line.startswith('ASPECT_SCORES:'):
-                current_section = 'aspect_scores'
-
-            elif line.startswith('STRENGTHS:'):
-                current_section = 'strengths'
-
-            elif line.startswith('WEAKNESSES:'):
-                current_section = 'weaknesses'
-
-            elif line.startswith('RECOMMENDATIONS:'):
-                current_section = 'recommendations'
-
-            elif line.startswith('ACCESSIBILITY_ISSUES:'):
-                current_section = 'accessibility_issues'
+            elif header is not None:
+                current_section = header
+                current_list = list_sections.get(header)
 
-            elif line.startswith('DETAILED_FEEDBACK:'):
-                current_section = 'detailed_feedback'
-
-            elif line.startswith('-'):
+            elif item is not None:
                 # List item
-                item = line[1:].strip()
-                if current_section == 'strengths':
-                    analysis.strengths.append(item)
-                elif current_section == 'weaknesses':
-                    analysis.weaknesses.append(item)
-                elif current_section == 'recommendations':
-                    analysis.recommendations.append(item)
-                elif current_section == 'accessibility_issues':
-                    analysis.accessibility_issues.append(item)
-
-            elif ':' in line and current_section == 'aspect_scores':
+                if current_list is not None:
+                    current_list.append(item.strip())
+
+            elif current_section == 'ASPECT_SCORES':
                 # Aspect score
                 try:
-                    aspect, score = line.split(':', 1)
-                    aspect = aspect.strip()
-                    score = float(score.strip())
-                    analysis.aspect_scores[aspect] = score
-                except:
+                    analysis.aspect_scores[key.strip()] = float(text)
+                except ValueError:
                     pass
 
-            elif ':' in line and current_section == 'detailed_feedback':
+            elif current_section == 'DETAILED_FEEDBACK':
                 # Detailed feedback
-                try:
-                    aspect, feedback = line.split(':', 1)
-                    aspect = aspect.strip()
-                    feedback = feedback.strip()
-                    analysis.detailed_feedback[aspect] = feedback
-                except:
-                    pass
+                analysis.detailed_feedback[key.strip()] = text.strip()
 
         return analysis
 
@@ -387,40 +881,49 @@ label_readability: [Detailed feedback about labels]
             )
             return analysis
 
-        try:
-            with Image.open(image_path) as img:
-                # Basic image analysis
-                width, height = img.size
-                aspect_ratio = width / height
-
-                # Analyze dimensions
-                if aspect_ratio > 2.0:
-                    analysis.weaknesses.append("Very wide aspect ratio may cause display issues")
-                elif aspect_ratio < 0.5:
-                    analysis.weaknesses.append("Very tall aspect ratio may cause display issues")
-                else:
-                    analysis.strengths.append("Good aspect ratio for dashboard viewing")
-
-                # Analyze size
-                if width >= 1920 and height >= 1080:
-                    analysis.strengths.append("High resolution suitable for detailed dashboards")
-                elif width < 800 or height < 600:
-                    analysis.weaknesses.append("Low resolution may affect readability")
+        metadata = analysis.image_metadata
 
-                # Color mode analysis
-                if img.mode == 'RGB':
-                    analysis.strengths.append("RGB color mode suitable for web display")
-                elif img.mode == 'RGBA':
-                    analysis.strengths.append("RGBA mode supports transparency")
-
-                # Set placeholder scores
-                analysis.overall_score = 75.0
-                for aspect in SCREENSHOT_ANALYSIS_ASPECTS:
-                    analysis.aspect_scores[aspect] = 75.0
+        try:
+            if 'width' in metadata and 'mode' in metadata:
+                # Reuse the header already read by _get_image_metadata
+                width, height = metadata['width'], metadata['height']
+                mode = metadata['mode']
+            else:
+                with Image.open(image_path) as img:
+                    width, height = img.size
+                    mode = img.mode
+
+            # Basic image analysis
+            aspect_ratio = width / height
+
+            # Analyze dimensions
+            if aspect_ratio > 2.0:
+                analysis.weaknesses.append("Very wide aspect ratio may cause display issues")
+            elif aspect_ratio < 0.5:
+                analysis.weaknesses.append("Very tall aspect ratio may cause display issues")
+            else:
+                analysis.strengths.append("Good aspect ratio for dashboard viewing")
+
+            # Analyze size
+            if width >= 1920 and height >= 1080:
+                analysis.strengths.append("High resolution suitable for detailed dashboards")
+            elif width < 800 or height < 600:
+                analysis.weaknesses.append("Low resolution may affect readability")
+
+            # Color mode analysis
+            if mode == 'RGB':
+                analysis.strengths.append("RGB color mode suitable for web display")
+            elif mode == 'RGBA':
+                analysis.strengths.append("RGBA mode supports transparency")
+
+            # Set placeholder scores
+            analysis.overall_score = 75.0
+            for aspect in SCREENSHOT_ANALYSIS_ASPECTS:
+                analysis.aspect_scores[aspect] = 75.0
 
-                analysis.recommendations.append(
-                    "For detailed UX analysis, enable AI mode with Anthropic API key"
-                )
+            analysis.recommendations.append(
+                "For detailed UX analysis, enable AI mode with Anthropic API key"
+            )
 
         except Exception as e:
             analysis.recommendations.append(f"Image analysis error: {str(e)}")
@@ -448,37 +951,36 @@ def generate_analysis_report(analysis: ScreenshotAnalysis) -> str:
     # Aspect scores
     if analysis.aspect_scores:
         report_lines.append("**Aspect Scores:**")
-        for aspect, score in sorted(analysis.aspect_scores.items(), key=lambda x: x[1], reverse=True):
-            aspect_name = aspect.replace('_', ' ').title()
-            report_lines.append(f"  - {aspect_name}: {score:.1f}/100")
+        report_lines.extend(
+            f"  - {aspect.replace('_', ' ').title()}: {score:.1f}/100"
+            for aspect, score in sorted(analysis.aspect_scores.items(), key=lambda x: x[1], reverse=True)
+        )
         report_lines.append("")
 
     # Strengths
     if analysis.strengths:
         report_lines.append("**Strengths:**")
-        for strength in analysis.strengths:
-            report_lines.append(f"   {strength}")
+        report_lines.extend(f"   {strength}" for strength in analysis.strengths)
         report_lines.append("")
 
     # Weaknesses
     if analysis.weaknesses:
         report_lines.append("**Areas for Improvement:**")
-        for weakness in analysis.weaknesses:
-            report_lines.append(f"    {weakness}")
+        report_lines.extend(f"    {weakness}" for weakness in analysis.weaknesses)
         report_lines.append("")
 
     # Accessibility
     if analysis.accessibility_issues:
         report_lines.append("**Accessibility Issues:**")
-        for issue in analysis.accessibility_issues:
-            report_lines.append(f"    {issue}")
+        report_lines.extend(f"    {issue}" for issue in analysis.accessibility_issues)
         report_lines.append("")
 
     # Recommendations
     if analysis.recommendations:
         report_lines.append("**Recommendations:**")
-        for i, rec in enumerate(analysis.recommendations, 1):
-            report_lines.append(f"  {i}. {rec}")
+        report_lines.extend(
+            f"  {i}. {rec}" for i, rec in enumerate(analysis.recommendations, 1)
+        )
         report_lines.append("")
 
     # Metadata
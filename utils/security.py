@@ -3,13 +3,14 @@ Security utilities for Tableau Data Assistant
 Handles API key encryption, file validation, and input sanitization
 """
 import os
+import re
 import hashlib
+import threading
+from collections import OrderedDict
+from functools import cached_property
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.backends import default_backend
 import base64
 
 # Optional import for python-magic
@@ -30,43 +31,117 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Read size for hash_file when hashlib.file_digest is unavailable
+HASH_BLOCK_SIZE = 1 << 20
+
+# Encryption keys already loaded or derived in this process, by key file
+_ENCRYPTION_KEYS: Dict[Path, bytes] = {}
+_ENCRYPTION_KEYS_LOCK = threading.Lock()
+
+# Leading bytes passed to libmagic; enough for every signature validate_file checks
+MIME_SNIFF_BYTES = 8192
+
+# MIME types libmagic may report for each allowed extension
+VALID_MIME_TYPES = {
+    '.csv': frozenset({'text/csv', 'text/plain', 'application/csv'}),
+    '.xlsx': frozenset({'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'}),
+    '.xls': frozenset({'application/vnd.ms-excel'}),
+    '.png': frozenset({'image/png'}),
+    '.jpg': frozenset({'image/jpeg'}),
+    '.jpeg': frozenset({'image/jpeg'}),
+    '.twb': frozenset({'text/xml', 'application/xml'}),
+    '.twbx': frozenset({'application/zip'})
+}
+
+# Single characters sanitize_filename replaces with '_'
+_FILENAME_TRANSLATION = str.maketrans({'/': '_', '\\': '_', '\x00': '_'})
+
+
+# MIME types of recent uploads (LRU), keyed on a BLAKE2b digest and length
+# of the sniffed bytes so no file content is kept alive
+_MIME_TYPES: "OrderedDict[Tuple[bytes, int], str]" = OrderedDict()
+_MIME_TYPES_MAXSIZE = 256
+
+
+def _detect_mime(head: bytes) -> str:
+    """Detect a MIME type from a file's leading bytes, caching repeat uploads"""
+    key = (hashlib.blake2b(head, digest_size=16).digest(), len(head))
+    try:
+        _MIME_TYPES.move_to_end(key)
+        return _MIME_TYPES[key]
+    except KeyError:
+        pass
+
+    mime_type = magic.from_buffer(head, mime=True)
+    _MIME_TYPES[key] = mime_type
+    if len(_MIME_TYPES) > _MIME_TYPES_MAXSIZE:
+        _MIME_TYPES.popitem(last=False)
+    return mime_type
+
 
 class SecurityManager:
     """Manages security operations"""
 
+    # Dangerous SQL keywords, matched in a single case-insensitive pass
+    DANGEROUS_SQL_PATTERN = re.compile(
+        r'\b(drop\s+table|drop\s+database|truncate|delete\s+from|insert\s+into|'
+        r'update\s|grant\s|revoke\s|create\s+user|drop\s+user|alter\s+user|'
+        r'exec\s|execute\s|xp_|sp_)',
+        re.IGNORECASE
+    )
+
     def __init__(self):
         """Initialize security manager"""
+        # The key itself is loaded on first use, so constructing a manager
+        # (e.g. at import time) does not touch the disk
         self.key_file = Path.home() / ".tableau_assistant" / "key.key"
-        self.key_file.parent.mkdir(exist_ok=True)
-        self._encryption_key = self._get_or_create_encryption_key()
+
+    @cached_property
+    def _encryption_key(self) -> bytes:
+        """Encryption key, loaded or created on first use"""
+        return self._get_or_create_encryption_key()
+
+    @cached_property
+    def _fernet(self) -> Fernet:
+        """Fernet wrapper around the encryption key"""
+        return Fernet(self._encryption_key)
 
     def _get_or_create_encryption_key(self) -> bytes:
         """
         Get or create encryption key for API keys
 
+        The key is read (or derived) once per process and key file; later
+        instances reuse it without touching the disk.
+
         Returns:
             Encryption key
         """
-        if self.key_file.exists():
-            with open(self.key_file, 'rb') as f:
-                return f.read()
-        else:
-            # Generate new key from machine-specific data
-            machine_id = self._get_machine_id()
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=b'tableau_assistant_salt',
-                iterations=100000,
-                backend=default_backend()
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(machine_id.encode()))
-
-            # Save key
-            with open(self.key_file, 'wb') as f:
-                f.write(key)
-            logger.info("Created new encryption key")
-
+        with _ENCRYPTION_KEYS_LOCK:
+            key = _ENCRYPTION_KEYS.get(self.key_file)
+            if key is not None:
+                return key
+
+            if self.key_file.exists():
+                with open(self.key_file, 'rb') as f:
+                    key = f.read()
+            else:
+                # Generate new key from machine-specific data
+                machine_id = self._get_machine_id()
+                key = base64.urlsafe_b64encode(hashlib.pbkdf2_hmac(
+                    'sha256',
+                    machine_id.encode(),
+                    b'tableau_assistant_salt',
+                    100000,
+                    dklen=32
+                ))
+
+                # Save key
+                self.key_file.parent.mkdir(exist_ok=True)
+                with open(self.key_file, 'wb') as f:
+                    f.write(key)
+                logger.info("Created new encryption key")
+
+            _ENCRYPTION_KEYS[self.key_file] = key
             return key
 
     def _get_machine_id(self) -> str:
@@ -97,8 +172,7 @@ class SecurityManager:
             Encrypted API key
         """
         try:
-            f = Fernet(self._encryption_key)
-            encrypted = f.encrypt(api_key.encode())
+            encrypted = self._fernet.encrypt(api_key.encode())
             logger.debug("API key encrypted successfully")
             return base64.urlsafe_b64encode(encrypted).decode()
         except Exception as e:
@@ -116,9 +190,8 @@ class SecurityManager:
             Plain API key
         """
         try:
-            f = Fernet(self._encryption_key)
             decoded = base64.urlsafe_b64decode(encrypted_key.encode())
-            decrypted = f.decrypt(decoded)
+            decrypted = self._fernet.decrypt(decoded)
             logger.debug("API key decrypted successfully")
             return decrypted.decode()
         except Exception as e:
@@ -160,11 +233,13 @@ class SecurityManager:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        suffix = file_path.suffix.lower()
+
         # Check file extension
-        if file_path.suffix.lower() not in ALLOWED_FILE_EXTENSIONS:
+        if suffix not in ALLOWED_FILE_EXTENSIONS:
             return False, f"File type {file_path.suffix} not allowed"
 
-        if file_path.suffix.lower() in DANGEROUS_EXTENSIONS:
+        if suffix in DANGEROUS_EXTENSIONS:
             return False, f"Dangerous file type {file_path.suffix} detected"
 
         # Check file size
@@ -177,23 +252,14 @@ class SecurityManager:
         if MAGIC_AVAILABLE:
             try:
                 if file_content:
-                    mime_type = magic.from_buffer(file_content, mime=True)
+                    head = file_content[:MIME_SNIFF_BYTES]
                 else:
-                    mime_type = magic.from_file(str(file_path), mime=True)
+                    with open(file_path, 'rb') as f:
+                        head = f.read(MIME_SNIFF_BYTES)
+                mime_type = _detect_mime(head)
 
                 # Validate MIME type matches extension
-                valid_mimes = {
-                    '.csv': ['text/csv', 'text/plain', 'application/csv'],
-                    '.xlsx': ['application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'],
-                    '.xls': ['application/vnd.ms-excel'],
-                    '.png': ['image/png'],
-                    '.jpg': ['image/jpeg'],
-                    '.jpeg': ['image/jpeg'],
-                    '.twb': ['text/xml', 'application/xml'],
-                    '.twbx': ['application/zip']
-                }
-
-                expected_mimes = valid_mimes.get(file_path.suffix.lower(), [])
+                expected_mimes = VALID_MIME_TYPES.get(suffix)
                 if expected_mimes and mime_type not in expected_mimes:
                     logger.warning(f"MIME type mismatch: {mime_type} for {file_path.suffix}")
                     # Don't block, just warn
@@ -217,10 +283,9 @@ class SecurityManager:
         # Remove path components
         filename = Path(filename).name
 
-        # Remove dangerous characters
-        dangerous_chars = ['..', '/', '\\', '\x00']
-        for char in dangerous_chars:
-            filename = filename.replace(char, '_')
+        # Remove dangerous characters in one pass; '..' spans two characters
+        # so it is replaced separately
+        filename = filename.translate(_FILENAME_TRANSLATION).replace('..', '_')
 
         # Limit length
         max_length = 255
@@ -240,10 +305,15 @@ class SecurityManager:
         Returns:
             Hex digest of file hash
         """
-        sha256 = hashlib.sha256()
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+
+            # Python < 3.11: hash 1 MiB blocks read into one reused buffer
+            sha256 = hashlib.sha256()
+            buffer = memoryview(bytearray(HASH_BLOCK_SIZE))
+            while n := f.readinto(buffer):
+                sha256.update(buffer[:n])
         return sha256.hexdigest()
 
     def sanitize_sql(self, sql_query: str) -> Tuple[bool, Optional[str]]:
@@ -256,18 +326,10 @@ class SecurityManager:
         Returns:
             Tuple of (is_safe, warning_message)
         """
-        # Dangerous SQL keywords
-        dangerous_keywords = [
-            'drop table', 'drop database', 'truncate', 'delete from',
-            'insert into', 'update ', 'grant ', 'revoke ',
-            'create user', 'drop user', 'alter user',
-            'exec ', 'execute ', 'xp_', 'sp_'
-        ]
-
-        sql_lower = sql_query.lower()
-        for keyword in dangerous_keywords:
-            if keyword in sql_lower:
-                return False, f"Potentially dangerous SQL detected: {keyword}"
+        match = self.DANGEROUS_SQL_PATTERN.search(sql_query)
+        if match:
+            keyword = ' '.join(match.group(1).lower().split())
+            return False, f"Potentially dangerous SQL detected: {keyword}"
 
         # Check for comment injection
         if '--' in sql_query or '/*' in sql_query or '*/' in sql_query:
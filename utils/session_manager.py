@@ -3,17 +3,100 @@ Session management for saving and loading chat sessions
 Allows users to persist and restore conversation history
 """
 import json
+import os
 import pickle
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 import hashlib
 
+# Optional: faster JSON encoding/decoding for session files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from config.settings import SESSIONS_DIR, SESSION_TIMEOUT, MAX_CHAT_HISTORY
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Summary of every saved session, so listing does not parse each session file
+INDEX_FILENAME = "_index.json"
+
+# HTML-escapes message text and turns newlines into <br> in one translate() pass
+_HTML_TRANSLATION = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+    '\n': '<br>',
+})
+
+# Write buffer for session files, so a long history goes out in few write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _dump_json(data: Dict) -> bytes:
+    """Serialize session data to indented UTF-8 JSON"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _atomic_write(path: Path, data: bytes):
+    """
+    Write a file so readers only ever see the old or the new contents
+
+    The data goes to a uniquely named temporary file in the same directory,
+    is flushed to disk, and then renamed over the target. Concurrent writers
+    of the same file each use their own temporary file, so the last rename
+    wins with complete contents.
+
+    Args:
+        path: File to write
+        data: Complete file contents
+    """
+    with tempfile.NamedTemporaryFile(
+        'wb',
+        buffering=WRITE_BUFFER_SIZE,
+        dir=path.parent,
+        prefix=f"{path.name}.",
+        suffix='.tmp',
+        delete=False
+    ) as f:
+        tmp_path = f.name
+        try:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _load_json(path) -> Dict:
+    """Read and parse a session JSON file"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class SessionManager:
     """Manage chat sessions with persistence"""
@@ -27,8 +110,124 @@ class SessionManager:
         """
         self.sessions_dir = sessions_dir
         self.sessions_dir.mkdir(exist_ok=True)
+        self._index_path = self.sessions_dir / INDEX_FILENAME
+        self._index: Optional[Dict[str, Dict]] = None
+        self._index_lock = threading.Lock()
+        # Directory mtime at the last reconciliation, and the mtime of each
+        # session file when its index entry was built
+        self._dir_mtime_ns: Optional[int] = None
+        self._file_mtimes: Dict[str, int] = {}
         logger.info(f"Session manager initialized: {sessions_dir}")
 
+    @staticmethod
+    def _summarize(session_data: Dict) -> Dict:
+        """Build the index entry for a session"""
+        return {
+            'session_id': session_data['session_id'],
+            'session_name': session_data.get('session_name', 'Unnamed'),
+            'created_at': session_data['created_at'],
+            'message_count': len(session_data.get('messages', [])),
+            'file_count': len(session_data.get('files_info', []))
+        }
+
+    def _get_index(self) -> Dict[str, Dict]:
+        """
+        Get the session index, reconciled with the session files on disk
+
+        The index is revalidated whenever the sessions directory's mtime
+        changes, so sessions written, replaced or removed by another process
+        or SessionManager instance are picked up. This relies on session
+        files being replaced rather than edited in place, as _atomic_write
+        does. Only session files that are new or modified since their entry
+        was built are parsed. Callers must hold _index_lock.
+
+        Returns:
+            Index entries keyed by session ID
+        """
+        dir_mtime_ns = os.stat(self.sessions_dir).st_mtime_ns
+        if self._index is not None and dir_mtime_ns == self._dir_mtime_ns:
+            return self._index
+
+        index = self._index
+        index_mtime_ns = None
+        if index is None:
+            index = {}
+            if self._index_path.exists():
+                try:
+                    index_mtime_ns = os.stat(self._index_path).st_mtime_ns
+                    index = _load_json(self._index_path)
+                except Exception as e:
+                    logger.warning(f"Failed to read session index, rebuilding: {e}")
+
+        with os.scandir(self.sessions_dir) as entries:
+            on_disk = {
+                entry.name[:-len('.json')]: (entry.path, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.name.endswith('.json')
+                and entry.name != INDEX_FILENAME
+                and entry.is_file(follow_symlinks=False)
+            }
+
+        changed = False
+        for session_id in list(index):
+            if session_id not in on_disk:
+                del index[session_id]
+                self._file_mtimes.pop(session_id, None)
+                changed = True
+
+        for session_id, (json_file, mtime_ns) in on_disk.items():
+            if session_id in index:
+                known_mtime_ns = self._file_mtimes.get(session_id)
+                if known_mtime_ns is None:
+                    # Entry from the stored index: trust it unless the
+                    # file was written after the index was
+                    fresh = index_mtime_ns is not None and mtime_ns <= index_mtime_ns
+                else:
+                    fresh = mtime_ns == known_mtime_ns
+                if fresh:
+                    self._file_mtimes[session_id] = mtime_ns
+                    continue
+            try:
+                index[session_id] = self._summarize(_load_json(json_file))
+                self._file_mtimes[session_id] = mtime_ns
+                changed = True
+            except Exception as e:
+                logger.warning(f"Failed to read session {json_file}: {e}")
+
+        self._index = index
+        self._dir_mtime_ns = dir_mtime_ns
+        if changed or not self._index_path.exists():
+            self._write_index()
+        return index
+
+    def _write_index(self):
+        """Atomically rewrite the index file"""
+        _atomic_write(self._index_path, _dump_json(self._index))
+
+    def _update_index(self, session_data: Dict):
+        """Add or replace a session's index entry"""
+        session_id = session_data['session_id']
+        summary = self._summarize(session_data)
+        mtime_ns = os.stat(self.sessions_dir / f"{session_id}.json").st_mtime_ns
+
+        with self._index_lock:
+            if self._index is not None:
+                # Record the entry first, so the rescan this write triggers
+                # does not parse the file that was just saved
+                self._index[session_id] = summary
+                self._file_mtimes[session_id] = mtime_ns
+            index = self._get_index()
+            index[session_id] = summary
+            self._file_mtimes[session_id] = mtime_ns
+            self._write_index()
+
+    def _remove_from_index(self, session_id: str):
+        """Drop a session's index entry"""
+        with self._index_lock:
+            self._file_mtimes.pop(session_id, None)
+            if self._get_index().pop(session_id, None) is not None:
+                self._write_index()
+
     def _generate_session_id(self, session_name: str = None) -> str:
         """
         Generate unique session ID
@@ -81,15 +280,10 @@ class SessionManager:
         # Save as JSON for readability
         json_file = self.sessions_dir / f"{session_id}.json"
         try:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            _atomic_write(json_file, _dump_json(session_data))
+            self._update_index(session_data)
             logger.info(f"Session saved: {session_id} ({len(messages)} messages)")
 
-            # Also save as pickle for complete state
-            pkl_file = self.sessions_dir / f"{session_id}.pkl"
-            with open(pkl_file, 'wb') as f:
-                pickle.dump(session_data, f)
-
             return session_id
 
         except Exception as e:
@@ -106,28 +300,30 @@ class SessionManager:
         Returns:
             Session data dictionary or None
         """
-        # Try pickle first (more complete)
+        json_file = self.sessions_dir / f"{session_id}.json"
+        if json_file.exists():
+            try:
+                session_data = _load_json(json_file)
+                logger.info(f"Session loaded (JSON): {session_id}")
+                return session_data
+            except Exception as e:
+                logger.error(f"Failed to load JSON session: {e}")
+
+        # Sessions saved by older versions may only have a pickle copy;
+        # migrate those to JSON the first time they are loaded
         pkl_file = self.sessions_dir / f"{session_id}.pkl"
         if pkl_file.exists():
             try:
                 with open(pkl_file, 'rb') as f:
                     session_data = pickle.load(f)
-                logger.info(f"Session loaded (pickle): {session_id}")
+                _atomic_write(json_file, _dump_json(session_data))
+                pkl_file.unlink()
+                self._update_index(session_data)
+                logger.info(f"Session loaded and migrated to JSON (pickle): {session_id}")
                 return session_data
             except Exception as e:
                 logger.warning(f"Failed to load pickle session: {e}")
 
-        # Fall back to JSON
-        json_file = self.sessions_dir / f"{session_id}.json"
-        if json_file.exists():
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
-                logger.info(f"Session loaded (JSON): {session_id}")
-                return session_data
-            except Exception as e:
-                logger.error(f"Failed to load JSON session: {e}")
-
         logger.warning(f"Session not found: {session_id}")
         return None
 
@@ -136,24 +332,11 @@ class SessionManager:
         List all available sessions
 
         Returns:
-            List of session metadata dictionaries
+            List of session metadata dictionaries (copies, so changing them
+            does not affect the index)
         """
-        sessions = []
-
-        for json_file in self.sessions_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
-
-                sessions.append({
-                    'session_id': session_data['session_id'],
-                    'session_name': session_data.get('session_name', 'Unnamed'),
-                    'created_at': session_data['created_at'],
-                    'message_count': len(session_data.get('messages', [])),
-                    'file_count': len(session_data.get('files_info', []))
-                })
-            except Exception as e:
-                logger.warning(f"Failed to read session {json_file}: {e}")
+        with self._index_lock:
+            sessions = [dict(entry) for entry in self._get_index().values()]
 
         # Sort by creation date, newest first
         sessions.sort(key=lambda x: x['created_at'], reverse=True)
@@ -192,6 +375,7 @@ class SessionManager:
                 logger.error(f"Failed to delete pickle session: {e}")
 
         if deleted:
+            self._remove_from_index(session_id)
             logger.info(f"Session deleted: {session_id}")
         else:
             logger.warning(f"Session not found for deletion: {session_id}")
@@ -211,21 +395,28 @@ class SessionManager:
         deleted_count = 0
         current_time = datetime.now()
 
-        for json_file in self.sessions_dir.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
-
-                created_at = datetime.fromisoformat(session_data['created_at'])
-                age_days = (current_time - created_at).days
-
-                if age_days > max_age_days:
-                    session_id = session_data['session_id']
-                    if self.delete_session(session_id):
+        with self._index_lock:
+            index = self._get_index()
+
+            for session_id, entry in list(index.items()):
+                try:
+                    created_at = datetime.fromisoformat(entry['created_at'])
+                    age_days = (current_time - created_at).days
+
+                    if age_days > max_age_days:
+                        # Remove the files directly and rewrite the index
+                        # once at the end, rather than per session
+                        for suffix in ('.json', '.pkl'):
+                            (self.sessions_dir / f"{session_id}{suffix}").unlink(missing_ok=True)
+                        del index[session_id]
+                        self._file_mtimes.pop(session_id, None)
                         deleted_count += 1
 
-            except Exception as e:
-                logger.warning(f"Failed to process session {json_file}: {e}")
+                except Exception as e:
+                    logger.warning(f"Failed to process session {session_id}: {e}")
+
+            if deleted_count:
+                self._write_index()
 
         logger.info(f"Cleaned up {deleted_count} old sessions")
         return deleted_count
@@ -250,33 +441,35 @@ class SessionManager:
         created_at = session_data.get('created_at', 'Unknown')
 
         if export_format == 'markdown':
-            export = f"# {session_name}\n\n"
-            export += f"**Created:** {created_at}\n\n"
-            export += f"**Messages:** {len(messages)}\n\n"
-            export += "---\n\n"
-
-            for msg in messages:
-                role = msg.get('role', 'unknown').capitalize()
-                content = msg.get('content', '')
-                export += f"## {role}\n\n{content}\n\n"
+            parts = [
+                f"# {session_name}\n\n",
+                f"**Created:** {created_at}\n\n",
+                f"**Messages:** {len(messages)}\n\n",
+                "---\n\n",
+            ]
+            parts.extend(
+                f"## {msg.get('role', 'unknown').capitalize()}\n\n{msg.get('content', '')}\n\n"
+                for msg in messages
+            )
 
         elif export_format == 'text':
-            export = f"{session_name}\n"
-            export += f"Created: {created_at}\n"
-            export += f"Messages: {len(messages)}\n"
-            export += "=" * 80 + "\n\n"
-
+            separator = "-" * 80 + "\n\n"
+            parts = [
+                f"{session_name}\n",
+                f"Created: {created_at}\n",
+                f"Messages: {len(messages)}\n",
+                "=" * 80 + "\n\n",
+            ]
             for msg in messages:
-                role = msg.get('role', 'unknown').upper()
-                content = msg.get('content', '')
-                export += f"{role}:\n{content}\n\n"
-                export += "-" * 80 + "\n\n"
+                parts.append(f"{msg.get('role', 'unknown').upper()}:\n{msg.get('content', '')}\n\n")
+                parts.append(separator)
 
         elif export_format == 'html':
-            export = f"""<!DOCTYPE html>
+            title = str(session_name).translate(_HTML_TRANSLATION)
+            parts = [f"""<!DOCTYPE html>
 <html>
 <head>
-    <title>{session_name}</title>
+    <title>{title}</title>
     <style>
         body {{ font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }}
         .message {{ margin: 20px 0; padding: 15px; border-radius: 5px; }}
@@ -286,28 +479,29 @@ class SessionManager:
     </style>
 </head>
 <body>
-    <h1>{session_name}</h1>
-    <p><strong>Created:</strong> {created_at}</p>
+    <h1>{title}</h1>
+    <p><strong>Created:</strong> {str(created_at).translate(_HTML_TRANSLATION)}</p>
     <p><strong>Messages:</strong> {len(messages)}</p>
     <hr>
-"""
+"""]
             for msg in messages:
-                role = msg.get('role', 'unknown')
-                content = msg.get('content', '').replace('\n', '<br>')
-                export += f"""
+                role = msg.get('role', 'unknown').translate(_HTML_TRANSLATION)
+                content = msg.get('content', '').translate(_HTML_TRANSLATION)
+                parts.append(f"""
     <div class="message {role}">
         <div class="role">{role.capitalize()}</div>
         <div>{content}</div>
     </div>
-"""
-            export += """
+""")
+            parts.append("""
 </body>
 </html>
-"""
+""")
         else:
             logger.error(f"Unsupported export format: {export_format}")
             return None
 
+        export = "".join(parts)
         logger.info(f"Session exported: {session_id} as {export_format}")
         return export
 
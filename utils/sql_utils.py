@@ -4,12 +4,106 @@ Provides query generation, optimization hints, and best practices
 """
 
 from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 import pandas as pd
 import re
 
 
+# DB-API placeholder token per database type: pyformat drivers (psycopg2,
+# mysqlclient, redshift_connector) vs qmark drivers (pyodbc, snowflake)
+_PARAMSTYLES = {
+    'postgres': '%s',
+    'mysql': '%s',
+    'redshift': '%s',
+    'sqlserver': '?',
+    'snowflake': '?',
+}
+DEFAULT_PARAMSTYLE = '?'
+
+_SCALAR_FILTER_TYPES = (str, int, float)
+
+
+def _filter_condition(
+    col: str,
+    value: Any,
+    placeholder: str,
+    params: List[Any],
+    allow_lists: bool = True
+) -> Optional[str]:
+    """
+    Render one parameterized WHERE condition and collect its bound values
+
+    Args:
+        col: Column name
+        value: Filter value
+        placeholder: Paramstyle token for the target database
+        params: List that bound values are appended to
+        allow_lists: Whether list values become IN clauses
+
+    Returns:
+        Condition string, or None if the value type is unsupported
+    """
+    if isinstance(value, list):
+        if not allow_lists:
+            return None
+        params.extend(value)
+        return f"{col} IN ({', '.join([placeholder] * len(value))})"
+
+    if isinstance(value, _SCALAR_FILTER_TYPES):
+        params.append(value)
+        return f"{col} = {placeholder}"
+
+    return None
+
+
+def _aggregate_expression(col: str, func: str) -> str:
+    """Render an aggregate select expression with its alias"""
+    return f"{func}({col}) AS {col}_{func.lower()}"
+
+
+def _select_keyword(limit: Optional[int]) -> Tuple[str, Optional[str]]:
+    """Limit rendering for databases without row limit support"""
+    return "SELECT", None
+
+
+def _trailing_limit(limit: Optional[int]) -> Tuple[str, Optional[str]]:
+    """Limit rendering for databases that use a trailing LIMIT clause"""
+    return "SELECT", (f"LIMIT {limit}" if limit else None)
+
+
+def _top_limit(limit: Optional[int]) -> Tuple[str, Optional[str]]:
+    """Limit rendering for databases that use SELECT TOP"""
+    return (f"SELECT TOP {limit}" if limit else "SELECT"), None
+
+
+# (SELECT keyword, trailing clause) renderers per database type
+_LIMIT_FORMATTERS = {
+    'postgres': _trailing_limit,
+    'mysql': _trailing_limit,
+    'redshift': _trailing_limit,
+    'snowflake': _trailing_limit,
+    'sqlserver': _top_limit,
+}
+
+
+# Every keyword optimize_query looks for, matched in a single pass.
+# SELECT * is its own group, so total SELECTs = star + select.
+_QUERY_SIGNALS = re.compile(
+    r'(?P<star>\bSELECT\s+\*)'
+    r'|(?P<where>\bWHERE\b)'
+    r'|(?P<limit>\bLIMIT\b)'
+    r'|(?P<distinct>\bDISTINCT\b)'
+    r'|(?P<select>\bSELECT\b)'
+    r'|(?P<join>\bJOIN\b)'
+    r'|(?P<orderby>\bORDER\s+BY\b)'
+    r'|(?P<agg>\b(?:SUM|COUNT|AVG|MAX|MIN)\s*\()',
+    re.IGNORECASE
+)
+
+
 @dataclass
 class SQLOptimizationReport:
     """Report of SQL optimization suggestions"""
@@ -48,6 +142,8 @@ class TableauSQLGenerator:
             database_type: Type of database ('postgres', 'mysql', 'sqlserver', 'redshift', 'snowflake', 'generic')
         """
         self.database_type = database_type.lower()
+        self._limit_fmt = _LIMIT_FORMATTERS.get(self.database_type, _select_keyword)
+        self._paramstyle = _PARAMSTYLES.get(self.database_type, DEFAULT_PARAMSTYLE)
 
     def generate_select_query(
         self,
@@ -57,10 +153,14 @@ class TableauSQLGenerator:
         limit: Optional[int] = None,
         order_by: Optional[List[str]] = None,
         aggregations: Optional[Dict[str, str]] = None
-    ) -> str:
+    ) -> Tuple[str, List[Any]]:
         """
         Generate optimized SELECT query for Tableau
 
+        Filter values are never inlined: each one becomes a placeholder in
+        the paramstyle of the target database and is returned separately
+        for the driver to bind, e.g. ``cursor.execute(sql, params)``.
+
         Args:
             table_name: Table name
             columns: List of columns to select (None for all)
@@ -70,50 +170,42 @@ class TableauSQLGenerator:
             aggregations: Dictionary of column: function ('SUM', 'AVG', etc.)
 
         Returns:
-            SQL query string
+            Tuple of (SQL query string, bound parameter values)
         """
         # Build SELECT clause
         if aggregations:
-            select_parts = []
-            for col, func in aggregations.items():
-                select_parts.append(f"{func}({col}) AS {col}_{func.lower()}")
-            select_clause = ", ".join(select_parts)
+            select_clause = ", ".join(
+                _aggregate_expression(col, func) for col, func in aggregations.items()
+            )
         elif columns:
             select_clause = ", ".join(columns)
         else:
             select_clause = "*"
 
-        query = f"SELECT {select_clause}\nFROM {table_name}"
+        select_keyword, limit_clause = self._limit_fmt(limit)
+        lines = [f"{select_keyword} {select_clause}", f"FROM {table_name}"]
+        params: List[Any] = []
 
         # Add WHERE clause
         if filters:
             where_parts = []
             for col, value in filters.items():
-                if isinstance(value, str):
-                    where_parts.append(f"{col} = '{value}'")
-                elif isinstance(value, (int, float)):
-                    where_parts.append(f"{col} = {value}")
-                elif isinstance(value, list):
-                    # IN clause
-                    values_str = ", ".join([f"'{v}'" if isinstance(v, str) else str(v) for v in value])
-                    where_parts.append(f"{col} IN ({values_str})")
+                condition = _filter_condition(col, value, self._paramstyle, params)
+                if condition is not None:
+                    where_parts.append(condition)
 
             if where_parts:
-                query += "\nWHERE " + " AND ".join(where_parts)
+                lines.append("WHERE " + " AND ".join(where_parts))
 
         # Add ORDER BY
         if order_by:
-            query += "\nORDER BY " + ", ".join(order_by)
+            lines.append("ORDER BY " + ", ".join(order_by))
 
         # Add LIMIT
-        if limit:
-            if self.database_type in ['postgres', 'mysql', 'redshift', 'snowflake']:
-                query += f"\nLIMIT {limit}"
-            elif self.database_type == 'sqlserver':
-                # SQL Server uses TOP
-                query = query.replace("SELECT", f"SELECT TOP {limit}", 1)
+        if limit_clause:
+            lines.append(limit_clause)
 
-        return query
+        return "\n".join(lines), params
 
     def generate_aggregation_query(
         self,
@@ -122,7 +214,7 @@ class TableauSQLGenerator:
         metrics: Dict[str, str],
         filters: Optional[Dict[str, Any]] = None,
         having: Optional[Dict[str, Any]] = None
-    ) -> str:
+    ) -> Tuple[str, List[Any]]:
         """
         Generate aggregation query optimized for Tableau
 
@@ -134,42 +226,38 @@ class TableauSQLGenerator:
             having: HAVING clause filters
 
         Returns:
-            SQL query string
+            Tuple of (SQL query string, bound parameter values in
+            WHERE-then-HAVING order)
         """
         # Build SELECT with dimensions and metrics
         select_parts = group_by.copy()
+        select_parts.extend(_aggregate_expression(col, func) for col, func in metrics.items())
 
-        for col, func in metrics.items():
-            select_parts.append(f"{func}({col}) AS {col}_{func.lower()}")
-
-        select_clause = ", ".join(select_parts)
-        query = f"SELECT {select_clause}\nFROM {table_name}"
+        lines = [f"SELECT {', '.join(select_parts)}", f"FROM {table_name}"]
+        params: List[Any] = []
 
         # WHERE clause
         if filters:
             where_parts = []
             for col, value in filters.items():
-                if isinstance(value, str):
-                    where_parts.append(f"{col} = '{value}'")
-                elif isinstance(value, (int, float)):
-                    where_parts.append(f"{col} = {value}")
+                condition = _filter_condition(
+                    col, value, self._paramstyle, params, allow_lists=False
+                )
+                if condition is not None:
+                    where_parts.append(condition)
 
             if where_parts:
-                query += "\nWHERE " + " AND ".join(where_parts)
+                lines.append("WHERE " + " AND ".join(where_parts))
 
         # GROUP BY
-        query += "\nGROUP BY " + ", ".join(group_by)
+        lines.append("GROUP BY " + ", ".join(group_by))
 
         # HAVING clause
         if having:
-            having_parts = []
-            for col, value in having.items():
-                having_parts.append(f"{col} > {value}")
+            params.extend(having.values())
+            lines.append("HAVING " + " AND ".join(f"{col} > {self._paramstyle}" for col in having))
 
-            if having_parts:
-                query += "\nHAVING " + " AND ".join(having_parts)
-
-        return query
+        return "\n".join(lines), params
 
     def generate_extract_query(
         self,
@@ -225,11 +313,10 @@ class SQLOptimizer:
         report = SQLOptimizationReport()
         report.original_query = query
 
-        query_upper = query.upper()
-        optimized = query
+        signals = Counter(match.lastgroup for match in _QUERY_SIGNALS.finditer(query))
 
         # Check for SELECT *
-        if 'SELECT *' in query_upper:
+        if signals['star']:
             report.suggestions.append(
                 "Replace SELECT * with explicit column names to reduce data transfer"
             )
@@ -238,7 +325,7 @@ class SQLOptimizer:
             )
 
         # Check for missing WHERE clause on large tables
-        if 'WHERE' not in query_upper and 'LIMIT' not in query_upper:
+        if not signals['where'] and not signals['limit']:
             report.suggestions.append(
                 "Consider adding WHERE clause or LIMIT to reduce result set size"
             )
@@ -247,20 +334,20 @@ class SQLOptimizer:
             )
 
         # Check for DISTINCT
-        if 'DISTINCT' in query_upper:
+        if signals['distinct']:
             report.performance_tips.append(
                 "DISTINCT can be expensive - consider if it's necessary or if duplicates can be handled in Tableau"
             )
 
         # Check for complex subqueries
-        subquery_count = query_upper.count('SELECT') - 1
+        subquery_count = signals['star'] + signals['select'] - 1
         if subquery_count > 2:
             report.suggestions.append(
                 f"Query contains {subquery_count} subqueries - consider simplifying or using CTEs"
             )
 
         # Check for missing indexes hints (for supported databases)
-        if 'JOIN' in query_upper:
+        if signals['join']:
             report.performance_tips.append(
                 "Ensure JOIN columns are indexed in the database for better performance"
             )
@@ -269,25 +356,25 @@ class SQLOptimizer:
             )
 
         # Check for aggregations
-        if any(agg in query_upper for agg in ['SUM(', 'COUNT(', 'AVG(', 'MAX(', 'MIN(']):
+        if signals['agg']:
             report.tableau_specific_tips.append(
                 "Consider letting Tableau handle aggregations for more flexible analysis"
             )
 
         # Check for ORDER BY
-        if 'ORDER BY' in query_upper and 'LIMIT' not in query_upper:
+        if signals['orderby'] and not signals['limit']:
             report.performance_tips.append(
                 "ORDER BY without LIMIT can be expensive - let Tableau handle sorting when possible"
             )
 
         # Suggest materialized views for complex queries
-        if subquery_count > 1 or 'JOIN' in query_upper:
+        if subquery_count > 1 or signals['join']:
             report.tableau_specific_tips.append(
                 "For frequently used complex queries, consider creating a materialized view or Tableau extract"
             )
 
         # Generate optimized query (basic optimizations)
-        optimized = self._apply_basic_optimizations(query)
+        optimized = self._apply_basic_optimizations(query, signals)
         report.optimized_query = optimized
 
         # Estimate improvement
@@ -300,12 +387,14 @@ class SQLOptimizer:
 
         return report
 
-    def _apply_basic_optimizations(self, query: str) -> str:
+    def _apply_basic_optimizations(self, query: str, signals: Optional[Counter] = None) -> str:
         """Apply basic automatic optimizations"""
         optimized = query
+        if signals is None:
+            signals = Counter(match.lastgroup for match in _QUERY_SIGNALS.finditer(query))
 
         # Add comment suggesting improvements
-        if 'SELECT *' in query.upper():
+        if signals['star']:
             optimized = "-- TODO: Replace SELECT * with explicit columns\n" + optimized
 
         return optimized
@@ -320,30 +409,35 @@ class SQLOptimizer:
         Returns:
             List of index suggestions
         """
-        suggestions = []
+        n_rows = len(df)
+        id_cols = [col for col in df.columns if 'id' in col.lower()]
+        int_cols = df.select_dtypes(include=['int64']).columns
+
+        # One vectorized nunique() over just the columns whose cardinality matters
+        candidate_cols = list(dict.fromkeys([*id_cols, *int_cols]))
+        cardinality_ratios = df[candidate_cols].nunique() / n_rows
 
         # Check for ID columns (likely primary keys)
-        id_cols = [col for col in df.columns if 'id' in col.lower()]
-        for col in id_cols:
-            if df[col].nunique() / len(df) > 0.95:  # High cardinality
-                suggestions.append(f"CREATE INDEX idx_{col} ON table_name({col});")
+        suggestions = [
+            f"CREATE INDEX idx_{col} ON table_name({col});"
+            for col in id_cols
+            if cardinality_ratios[col] > 0.95  # High cardinality
+        ]
 
         # Check for date columns
-        date_cols = df.select_dtypes(include=['datetime64']).columns
-        for col in date_cols:
-            suggestions.append(
-                f"CREATE INDEX idx_{col} ON table_name({col}); -- For date range filters"
-            )
+        suggestions.extend(
+            f"CREATE INDEX idx_{col} ON table_name({col}); -- For date range filters"
+            for col in df.select_dtypes(include=['datetime64']).columns
+        )
 
         # Check for foreign key candidates
-        for col in df.select_dtypes(include=['int64']).columns:
-            if col not in id_cols:
-                cardinality_ratio = df[col].nunique() / len(df)
-                if 0.01 < cardinality_ratio < 0.5:  # Potential foreign key
-                    suggestions.append(
-                        f"-- Consider indexing {col} if it's a foreign key\n"
-                        f"CREATE INDEX idx_{col} ON table_name({col});"
-                    )
+        id_col_set = set(id_cols)
+        suggestions.extend(
+            f"-- Consider indexing {col} if it's a foreign key\n"
+            f"CREATE INDEX idx_{col} ON table_name({col});"
+            for col in int_cols
+            if col not in id_col_set and 0.01 < cardinality_ratios[col] < 0.5  # Potential foreign key
+        )
 
         return suggestions
 
@@ -355,6 +449,7 @@ class TableauCustomSQLHelper:
     """
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def generate_initial_sql_template(table_name: str) -> str:
         """Generate Tableau custom SQL template"""
         return f"""-- Tableau Custom SQL Template
@@ -391,6 +486,7 @@ GROUP BY
 """
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def generate_incremental_extract_sql(
         table_name: str,
         date_column: str,
@@ -420,10 +516,20 @@ WHERE {date_column} >= DATEADD(day, -7, CURRENT_DATE)  -- Last 7 days
         measures: List[str]
     ) -> str:
         """Generate optimized SQL for Tableau live connection"""
-        dim_str = ",\n    ".join(dimensions)
-        measure_str = ",\n    ".join([f"SUM({m}) AS total_{m}" for m in measures])
+        return _render_live_connection_sql(table_name, tuple(dimensions), tuple(measures))
 
-        return f"""-- Tableau Live Connection SQL
+
+@lru_cache(maxsize=256)
+def _render_live_connection_sql(
+    table_name: str,
+    dimensions: Tuple[str, ...],
+    measures: Tuple[str, ...]
+) -> str:
+    """Render the live connection template (column lists as hashable tuples)"""
+    dim_str = ",\n    ".join(dimensions)
+    measure_str = ",\n    ".join([f"SUM({m}) AS total_{m}" for m in measures])
+
+    return f"""-- Tableau Live Connection SQL
 -- Optimized for real-time dashboard queries
 
 SELECT
@@ -513,7 +619,7 @@ def generate_tableau_sql(
     table_name: str,
     database_type: str = 'generic',
     **kwargs
-) -> str:
+) -> Tuple[str, List[Any]]:
     """
     Generate Tableau-optimized SQL query
 
@@ -523,7 +629,7 @@ def generate_tableau_sql(
         **kwargs: Additional parameters (columns, filters, etc.)
 
     Returns:
-        SQL query string
+        Tuple of (SQL query string, bound parameter values)
     """
     generator = TableauSQLGenerator(database_type=database_type)
     return generator.generate_select_query(table_name, **kwargs)